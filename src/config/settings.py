@@ -1,36 +1,75 @@
 import os
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-from pydantic import BaseModel, Field
-from dotenv import load_dotenv
+from dataclasses import dataclass, field
+from pydantic import AliasChoices, Field, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
-# Load environment variables
-load_dotenv()
+# Sentinel so .env is read and parsed at most once per process,
+# no matter how many times this module is imported or Settings.load() runs
+_DOTENV_LOADED = False
 
-class HyperliquidConfig(BaseModel):
-    api_url: str = Field(default="https://api.hyperliquid.xyz")
-    ws_url: str = Field(default="wss://api.hyperliquid.xyz/ws")
+def _ensure_dotenv():
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        try:
+            # Deployments can pre-bake .env into a module (tools/bake_env.py)
+            # so startup loads an already-parsed .pyc instead of tokenizing
+            from ._baked_env import ENV
+            for key, value in ENV.items():
+                os.environ.setdefault(key, value)
+        except ImportError:
+            # Deferred so modules importing settings without loading them
+            # never pay the dotenv import cost
+            from dotenv import load_dotenv
+            load_dotenv(override=False)
+        _DOTENV_LOADED = True
+
+# Accepted "true" spellings for boolean env vars, hoisted to module scope
+# so parsing is a single O(1) frozenset lookup
+_TRUTHY = frozenset({'true', '1', 'yes', 't', 'y', 'on'})
+
+def _env_bool(name: str, default: str, _get=os.environ.get) -> bool:
+    """Parse a boolean environment variable"""
+    return _get(name, default).lower() in _TRUTHY
+
+def _env_opt(name: str, conv, _get=os.environ.get):
+    """Parse an optional numeric env var where 'x' (the default) means unlimited"""
+    value = _get(name, 'x')
+    # plain == 'x' first: the common default case never allocates a lowercase copy
+    return None if value == 'x' or value.lower() == 'x' else conv(value)
+
+@dataclass(slots=True)
+class HyperliquidConfig:
+    api_url: str = "https://api.hyperliquid.xyz"
+    ws_url: str = "wss://api.hyperliquid.xyz/ws"
     wallet_address: Optional[str] = None
     private_key: Optional[str] = None
 
-class TelegramConfig(BaseModel):
+@dataclass(slots=True)
+class TelegramConfig:
     bot_token: Optional[str] = None
     chat_id: Optional[str] = None
     report_interval_hours: int = 1
 
-class SizingConfig(BaseModel):
+@dataclass(slots=True)
+class SizingConfig:
     mode: str = "proportional"  # "fixed" or "proportional"
     fixed_size: float = 100.0
     portfolio_ratio: float = 0.01  # 1:100 ratio
     max_position_size: float = 1000.0
     max_total_exposure: float = 5000.0
 
-class LeverageConfig(BaseModel):
+@dataclass(slots=True)
+class LeverageConfig:
     adjustment_ratio: float = 0.5
     max_leverage: float = 10.0
     min_leverage: float = 1.0
 
-class CopyRulesConfig(BaseModel):
+@dataclass(slots=True)
+class CopyRulesConfig:
     copy_existing_positions: bool = True
     copy_existing_orders: bool = True
     copy_open_positions: bool = True
@@ -42,98 +81,145 @@ class CopyRulesConfig(BaseModel):
     min_entry_quality_pct: float = 5.0
     max_slippage_pct: float = 1.0
     min_position_size_usd: float = 10.0
-    blocked_assets: list[str] = []  # Assets to NOT copy (e.g., ["BTC", "ETH"])
+    blocked_assets: frozenset[str] = frozenset()  # Assets to NOT copy (e.g., {"BTC", "ETH"})
 
-class RiskManagementConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class RiskManagementConfig:
     max_concurrent_positions: int = 10
     max_daily_loss_usd: float = 500.0
     enable_custom_stops: bool = False
     stop_loss_pct: float = 5.0
 
-class Settings(BaseModel):
-    # Target wallet
-    target_wallet: str = "0x0ba5de43fa2419a25c2e680f84aff3a8f57fce22"
+# Shared frozen default - every Settings() reuses this instance instead of
+# allocating a new one. The other sections stay per-instance because they
+# are populated from env vars or mutated at startup (sizing ratio).
+_DEFAULT_RISK_MANAGEMENT = RiskManagementConfig()
+
+def _hyperliquid_from_env() -> HyperliquidConfig:
+    get = os.environ.get
+    cfg = HyperliquidConfig()
+    cfg.api_url = get('HYPERLIQUID_API_URL', cfg.api_url)
+    wallet_address = get('HYPERLIQUID_WALLET_ADDRESS')
+    # Normalize + intern once so downstream address comparisons are
+    # pointer-fast instead of re-lowercasing per event
+    cfg.wallet_address = sys.intern(wallet_address.lower()) if wallet_address else None
+    cfg.private_key = get('HYPERLIQUID_PRIVATE_KEY')
+    return cfg
+
+def _telegram_from_env() -> TelegramConfig:
+    get = os.environ.get
+    cfg = TelegramConfig()
+    cfg.bot_token = get('TELEGRAM_BOT_TOKEN')
+    cfg.chat_id = get('TELEGRAM_CHAT_ID')
+    return cfg
+
+def _leverage_from_env(_float=float, _get=os.environ.get) -> LeverageConfig:
+    # default-arg bindings keep the parse entirely LOAD_FAST-driven
+    cfg = LeverageConfig()
+    cfg.adjustment_ratio = _float(_get('LEVERAGE_ADJUSTMENT', '0.5'))
+    return cfg
+
+def _copy_rules_from_env() -> CopyRulesConfig:
+    get = os.environ.get
+    cfg = CopyRulesConfig()
+    cfg.copy_open_positions = _env_bool('COPY_OPEN_POSITIONS', 'true')
+    cfg.copy_existing_orders = _env_bool('COPY_EXISTING_ORDERS', 'true')
+    cfg.auto_adjust_size = _env_bool('AUTO_ADJUST_SIZE', 'true')
+    cfg.use_limit_orders = _env_bool('USE_LIMIT_ORDERS', 'false')
+
+    cfg.max_open_trades = _env_opt('MAX_OPEN_TRADES', int)
+    cfg.max_open_orders = _env_opt('MAX_OPEN_ORDERS', int)
+    cfg.max_account_equity = _env_opt('MAX_ACCOUNT_EQUITY', float)
+
+    # Blocked assets - one upper() over the whole string instead of per token;
+    # frozenset gives O(1) membership on the per-trade blocked check
+    blocked = get('BLOCKED_ASSETS', '').upper()
+    if blocked:
+        cfg.blocked_assets = frozenset(
+            asset for asset in (part.strip() for part in blocked.split(',')) if asset
+        )
+    return cfg
+
+class Settings(BaseSettings):
+    # Target wallet (TARGET_WALLET_ADDRESS); remaining scalars map to their
+    # upper-cased env names automatically (case-insensitive matching)
+    target_wallet: str = Field(
+        "0x0ba5de43fa2419a25c2e680f84aff3a8f57fce22",
+        validation_alias=AliasChoices('TARGET_WALLET_ADDRESS', 'target_wallet')
+    )
     
     # Trading mode
     simulated_trading: bool = True
     simulated_account_balance: float = 1000.0
     
-    # Configuration sections
-    hyperliquid: HyperliquidConfig = Field(default_factory=HyperliquidConfig)
-    telegram: TelegramConfig = Field(default_factory=TelegramConfig)
+    # Configuration sections, each populated from its env vars in one pass
+    hyperliquid: HyperliquidConfig = Field(default_factory=_hyperliquid_from_env)
+    telegram: TelegramConfig = Field(default_factory=_telegram_from_env)
     sizing: SizingConfig = Field(default_factory=SizingConfig)
-    leverage: LeverageConfig = Field(default_factory=LeverageConfig)
-    copy_rules: CopyRulesConfig = Field(default_factory=CopyRulesConfig)
-    risk_management: RiskManagementConfig = Field(default_factory=RiskManagementConfig)
+    leverage: LeverageConfig = Field(default_factory=_leverage_from_env)
+    copy_rules: CopyRulesConfig = Field(default_factory=_copy_rules_from_env)
+    risk_management: RiskManagementConfig = Field(default_factory=lambda: _DEFAULT_RISK_MANAGEMENT)
     
     # Paths
     log_level: str = "INFO"
     log_file: str = "./logs/trading.log"
     database_url: str = "sqlite:///./data/trading.db"
     
-    class Config:
-        env_file = '.env'
-        env_file_encoding = 'utf-8'
+    # Frozen so the get_settings() singleton can be shared across asyncio
+    # tasks and threads without defensive copies. Nested sections stay
+    # mutable dataclasses (the sizing ratio is auto-tuned at startup).
+    model_config = SettingsConfigDict(
+        env_file='.env', env_file_encoding='utf-8', extra='ignore', frozen=True
+    )
+
+    @field_validator('target_wallet')
+    @classmethod
+    def _normalize_target_wallet(cls, v: str) -> str:
+        # Lowercase + intern once at load; websocket-event address checks
+        # then compare interned strings instead of strcmp over 42 chars
+        return sys.intern(v.lower())
+
+    def model_post_init(self, __context) -> None:
+        # Denormalized copies of per-tick copy_rules fields so hot loops do a
+        # single attribute hop instead of two model dispatches. Only fields
+        # that never change after load are shadowed here (portfolio_ratio is
+        # re-tuned at startup, so it must be read through sizing).
+        object.__setattr__(self, '_blocked_assets', self.copy_rules.blocked_assets)
+        object.__setattr__(self, '_max_slippage_pct', self.copy_rules.max_slippage_pct)
+        object.__setattr__(self, '_min_position_size_usd', self.copy_rules.min_position_size_usd)
 
     @classmethod
     def load(cls) -> 'Settings':
-        """Load settings from environment variables"""
-        settings = cls()
-        
-        # Load from environment
-        settings.hyperliquid.api_url = os.getenv('HYPERLIQUID_API_URL', settings.hyperliquid.api_url)
-        settings.hyperliquid.wallet_address = os.getenv('HYPERLIQUID_WALLET_ADDRESS')
-        settings.hyperliquid.private_key = os.getenv('HYPERLIQUID_PRIVATE_KEY')
-
-        settings.target_wallet = os.getenv('TARGET_WALLET_ADDRESS', settings.target_wallet)
-        
-        # Trading mode
-        sim_trading = os.getenv('SIMULATED_TRADING', 'true').lower()
-        settings.simulated_trading = sim_trading in ('true', '1', 'yes')
-        
-        sim_balance = os.getenv('SIMULATED_ACCOUNT_BALANCE', '1000.0')
-        settings.simulated_account_balance = float(sim_balance)
-        
-        # Copy trading settings
-        copy_open_pos = os.getenv('COPY_OPEN_POSITIONS', 'true').lower()
-        settings.copy_rules.copy_open_positions = copy_open_pos in ('true', '1', 'yes')
-        
-        copy_orders = os.getenv('COPY_EXISTING_ORDERS', 'true').lower()
-        settings.copy_rules.copy_existing_orders = copy_orders in ('true', '1', 'yes')
-        
-        auto_adjust = os.getenv('AUTO_ADJUST_SIZE', 'true').lower()
-        settings.copy_rules.auto_adjust_size = auto_adjust in ('true', '1', 'yes')
-        
-        use_limit = os.getenv('USE_LIMIT_ORDERS', 'false').lower()
-        settings.copy_rules.use_limit_orders = use_limit in ('true', '1', 'yes')
-        
-        # Leverage adjustment
-        leverage_adj = os.getenv('LEVERAGE_ADJUSTMENT', '0.5')
-        settings.leverage.adjustment_ratio = float(leverage_adj)
-        
-        max_trades = os.getenv('MAX_OPEN_TRADES', 'x')
-        settings.copy_rules.max_open_trades = None if max_trades.lower() == 'x' else int(max_trades)
-        
-        max_orders = os.getenv('MAX_OPEN_ORDERS', 'x')
-        settings.copy_rules.max_open_orders = None if max_orders.lower() == 'x' else int(max_orders)
-        
-        max_equity = os.getenv('MAX_ACCOUNT_EQUITY', 'x')
-        settings.copy_rules.max_account_equity = None if max_equity.lower() == 'x' else float(max_equity)
-        
-        # Blocked assets
-        blocked = os.getenv('BLOCKED_ASSETS', '')
-        settings.copy_rules.blocked_assets = [
-            asset.strip().upper() for asset in blocked.split(',') if asset.strip()
-        ]
-        
-        settings.telegram.bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
-        settings.telegram.chat_id = os.getenv('TELEGRAM_CHAT_ID')
-        
-        settings.log_level = os.getenv('LOG_LEVEL', settings.log_level)
-        settings.log_file = os.getenv('LOG_FILE', settings.log_file)
-        settings.database_url = os.getenv('DATABASE_URL', settings.database_url)
-        
-        return settings
-
-# Global settings instance
-settings = Settings.load()
+        """Load settings from the environment (declarative pydantic-settings pass)"""
+        _ensure_dotenv()
+        return cls()
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the shared Settings instance, constructed lazily on first use"""
+    return Settings.load()
+
+
+@lru_cache(maxsize=None)
+def get_setting(path: str):
+    """Resolve a dotted settings path (e.g. 'copy_rules.blocked_assets') once.
+
+    Hot paths can read a cached value with a single call instead of
+    traversing the nested config attributes on every tick. Only use this
+    for fields that stay stable after startup.
+    """
+    value = get_settings()
+    for part in path.split('.'):
+        value = getattr(value, part)
+    return value
+
+
+def __getattr__(name: str):
+    # Keep `from config.settings import settings` working without paying
+    # the env-parsing cost at import time. The instance is written back
+    # into the module dict so this hook only ever fires once.
+    if name == 'settings':
+        instance = get_settings()
+        globals()['settings'] = instance
+        return instance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,77 @@
+"""Numeric formatting kernels for the order hot path
+
+Pure functions extracted from TradeExecutor so they can be JIT-compiled
+with numba where it is installed. Without numba the decorator is a
+no-op and the pure-Python path runs unchanged.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(**kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+_POW10 = tuple(10 ** i for i in range(13))
+
+# Bound format method for the fixed 5-significant-figure price spec -
+# avoids re-parsing the format spec on every call
+fmt5g = "{:.5g}".format
+
+
+@njit(cache=True)
+def _scale_round(value: float, multiplier: int) -> int:
+    return int(round(value * multiplier))
+
+
+def format_size(size: float, sz_decimals: int = 5) -> str:
+    """Format size with appropriate decimal places for Hyperliquid
+
+    Args:
+        size: Order size
+        sz_decimals: Number of decimal places allowed for this asset
+
+    Returns:
+        Formatted size string
+    """
+    if size == 0:
+        return "0"
+
+    # Work on the magnitude: a sign character inside the digit string
+    # breaks the padding/splicing below, so it is re-attached at the end
+    sign = "-" if size < 0 else ""
+    magnitude = -size if size < 0 else size
+
+    # Integer scaling: round once, then splice the digits directly
+    # instead of parsing a dynamic format spec and double-rstripping
+    scaled = _scale_round(magnitude, _POW10[sz_decimals])
+    if scaled == 0:
+        return "0"
+
+    digits = str(scaled)
+    if sz_decimals == 0:
+        return sign + digits
+    if len(digits) <= sz_decimals:
+        digits = "0" * (sz_decimals + 1 - len(digits)) + digits
+
+    frac = digits[-sz_decimals:].rstrip("0")
+    whole = digits[:-sz_decimals]
+    return f"{sign}{whole}.{frac}" if frac else sign + whole
+
+
+def slippage_price(price: float, is_buy: bool, slippage: float = 0.03) -> str:
+    """Calculate price with slippage for market orders
+
+    Args:
+        price: Current market price
+        is_buy: True for buy orders, False for sell
+        slippage: Slippage percentage (default 3%)
+
+    Returns:
+        Price string with slippage applied
+    """
+    # Apply slippage: higher price for buys, lower for sells
+    adjusted = price * (1 + slippage) if is_buy else price * (1 - slippage)
+    # Round to 5 significant figures
+    return fmt5g(adjusted)
@@ -1,28 +1,64 @@
 """Trade execution engine for Hyperliquid"""
+import asyncio
+import threading
 import time
 import json
 from typing import Optional, Dict, Any
-from decimal import Decimal
 from eth_account import Account
-from eth_account.messages import encode_structured_data
 from eth_utils import keccak, to_hex
 import aiohttp
 import msgpack
+import orjson
+
+try:
+    # Tuned C Keccak-256 - noticeably faster than the eth_utils dispatch
+    # on the short (<200 B) action payloads we hash per order
+    from Crypto.Hash import keccak as _pycryptodome_keccak
+
+    def keccak256(data: bytes) -> bytes:
+        h = _pycryptodome_keccak.new(digest_bits=256)
+        h.update(data)
+        return h.digest()
+except ImportError:
+    keccak256 = keccak
 
 from utils.logger import logger
 from hyperliquid.models import OrderType, OrderSide
+from ._fastfmt import format_size, slippage_price, fmt5g
+
+# EIP-712 constants for Hyperliquid's Exchange domain (chainId 1337,
+# version 1, zero verifying contract). Global for the whole API, so they
+# are computed once at import and shared by every executor instance.
+_HL_DOMAIN_SEPARATOR = keccak(
+    keccak(b"EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)")
+    + keccak(b"Exchange")
+    + keccak(b"1")
+    + (1337).to_bytes(32, "big")
+    + bytes(32)  # zero verifying contract, left-padded to 32 bytes
+)
+_AGENT_TYPEHASH = keccak(b"Agent(string source,bytes32 connectionId)")
+_SOURCE_A = keccak(b"a")  # "a" = mainnet phantom-agent source
 
 
 class TradeExecutor:
     """Executes trades on Hyperliquid exchange"""
     
+    # Shared constant order-type sub-dicts - these never change per order,
+    # so every submission reuses them instead of allocating fresh nested
+    # dicts. (Full order templates are deliberately not shared: concurrent
+    # submissions would race on in-place mutation.)
+    _TIF_IOC = {"limit": {"tif": "Ioc"}}
+    _TIF_GTC = {"limit": {"tif": "Gtc"}}
+    _TIF_ALO = {"limit": {"tif": "Alo"}}
+    
     def __init__(
         self,
         wallet_address: str,
         private_key: str,
         info_url: str = "https://api.hyperliquid.xyz/info",
         exchange_url: str = "https://api.hyperliquid.xyz/exchange",
-        dry_run: bool = True
+        dry_run: bool = True,
+        session: Optional[aiohttp.ClientSession] = None
     ):
         """Initialize trade executor
         
@@ -32,6 +68,7 @@ class TradeExecutor:
             info_url: Hyperliquid info API URL
             exchange_url: Hyperliquid exchange API URL
             dry_run: If True, simulate orders without executing
+            session: Optional shared aiohttp session (caller owns lifecycle)
         """
         self.wallet_address = wallet_address.lower() if wallet_address else None
         self.private_key = private_key
@@ -39,6 +76,57 @@ class TradeExecutor:
         self.exchange_url = exchange_url
         self.dry_run = dry_run
         
+        # Shared HTTP session - created lazily, reused across all API calls
+        # so connections (DNS + TLS) are kept alive between orders. When
+        # injected, the pool is shared app-wide and the caller closes it
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
+        
+        # Fixed-layout hash input buffers. Both signing digests have a
+        # constant shape (typehash||source||connectionId and
+        # \x19\x01||domain||structHash), so the constant prefixes are
+        # written once and only the trailing 32 bytes change per order
+        self._struct_buf = bytearray(_AGENT_TYPEHASH + _SOURCE_A + bytes(32))
+        self._digest_buf = bytearray(b"\x19\x01" + _HL_DOMAIN_SEPARATOR + bytes(32))
+
+        # Monotonic nonce state - two orders landing in the same
+        # millisecond must not produce duplicate nonces
+        self._nonce_lock = threading.Lock()
+        self._last_nonce = 0
+
+        # Reusable single-entry cancel action - only the asset index and
+        # order id change per cancel. Safe to share because mutation,
+        # signing and serialization all happen without an await between
+        self._cancel_template = {"type": "cancel", "cancels": [{"a": 0, "o": 0}]}
+
+        # Precomputed vault tail for action hashing - this executor always
+        # signs for its own wallet, so the no-vault indicator byte is fixed
+        self._vault_tail = b"\x00"
+
+        # Reusable msgpack encoder for action hashing - packb() constructs a
+        # fresh Packer per call. autoreset keeps the internal buffer clean
+        # between actions; defaults otherwise match packb (and the SDK)
+        self._packer = msgpack.Packer(autoreset=True)
+        
+        # TTL-cached asset metadata (index + szDecimals per symbol) so
+        # orders don't re-download the full meta universe every time
+        self._asset_cache: Dict[str, dict] = {}
+        self._asset_cache_ts: float = 0.0
+        self._meta_ttl: float = 300.0
+        self._meta_lock = asyncio.Lock()
+        
+        # Very short-TTL mid-price cache - back-to-back orders on the same
+        # symbol (open, then TP, then SL) reuse one allMids fetch
+        self._mid_cache: Dict[str, tuple] = {}
+        self._mid_ttl: float = 0.2
+
+        # Short-TTL cache of your clearinghouseState so balance and
+        # position reads within the same tick share one round-trip
+        self._chs_cache: Optional[dict] = None
+        self._chs_cache_ts: float = 0.0
+        self._chs_ttl: float = 1.0
+        self._chs_lock = asyncio.Lock()
+        
         # Initialize signing account if we have credentials
         self.account = None
         if self.private_key and not self.dry_run:
@@ -55,6 +143,10 @@ class TradeExecutor:
                         f"Private key address {self.account.address} doesn't match "
                         f"configured address {self.wallet_address}"
                     )
+                # Bind the coincurve-backed raw digest signer once; it
+                # skips sign_message's SignableMessage construction and
+                # redundant rehash of the already-final EIP-712 digest
+                self._sign_digest = self.account._key_obj.sign_msg_hash
                 logger.info(f"✅ Executor initialized for wallet {self.wallet_address}")
             except Exception as e:
                 logger.error(f"Failed to initialize signing account: {e}")
@@ -64,27 +156,71 @@ class TradeExecutor:
         else:
             logger.warning("⚠️ Running in DRY RUN mode - no real trades will be executed")
     
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use
+        
+        A single keep-alive session avoids paying DNS resolution and the
+        TLS handshake on every order.
+        """
+        if self._session is None or self._session.closed:
+            # Pool sized for the parallel info fetches an order fires at
+            # once; long keep-alive so connections survive between orders
+            self._owns_session = True
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32,
+                    limit_per_host=16,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60,
+                    enable_cleanup_closed=True
+                ),
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self._session
+    
+    async def close(self):
+        """Close the HTTP session, if this executor owns it"""
+        if self._session and self._owns_session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+    
     def _action_hash(self, action: Dict[str, Any], vault_address: Optional[str], nonce: int) -> bytes:
         """Compute action hash as per Hyperliquid SDK
         
         This is exactly how the official SDK computes the connectionId:
         keccak(msgpack(action) + nonce_bytes + vault_address_indicator)
         """
-        data = msgpack.packb(action)
-        data += nonce.to_bytes(8, "big")
+        buf = bytearray(self._packer.pack(action))
+        buf += nonce.to_bytes(8, "big")
         if vault_address is None:
-            data += b"\x00"
+            buf += self._vault_tail
         else:
-            data += b"\x01"
-            # Convert address to bytes (strip 0x prefix if present)
-            addr = vault_address[2:] if vault_address.startswith("0x") else vault_address
-            data += bytes.fromhex(addr)
-        return keccak(data)
+            # Rare vault path: indicator byte + address bytes (strip 0x prefix)
+            buf.append(1)
+            buf += bytes.fromhex(vault_address.removeprefix("0x"))
+        return keccak256(bytes(buf))
+    
+    def _next_nonce(self) -> int:
+        """Millisecond timestamp nonce, bumped monotonically on collisions"""
+        with self._nonce_lock:
+            nonce = time.time_ns() // 1_000_000
+            if nonce <= self._last_nonce:
+                nonce = self._last_nonce + 1
+            self._last_nonce = nonce
+            return nonce
     
     def _sign_action(self, action: Dict[str, Any], vault_address: Optional[str] = None) -> Dict[str, Any]:
-        """Sign an action using EIP-712 structured data signing
+        """Sign an action using EIP-712 signing over a precomputed domain
         
-        This implementation matches the official hyperliquid-python-sdk exactly.
+        Produces byte-identical signatures to the official
+        hyperliquid-python-sdk's encode_structured_data path.
         
         Args:
             action: Action to sign
@@ -97,57 +233,27 @@ class TradeExecutor:
             raise ValueError("Cannot sign actions without account")
         
         # Timestamp nonce in milliseconds
-        nonce = int(time.time() * 1000)
+        nonce = self._next_nonce()
         
         # Compute the action hash (connectionId) - this is the critical part!
         # The SDK hashes: msgpack(action) + nonce_bytes + vault_indicator
         connection_id = self._action_hash(action, vault_address, nonce)
         
-        # Construct phantom agent - "a" for mainnet, "b" for testnet
-        phantom_agent = {"source": "a", "connectionId": connection_id}
-        
-        # Create EIP-712 structured data - field order matters!
-        # Using exact same structure as official SDK
-        structured_data = {
-            "domain": {
-                "chainId": 1337,
-                "name": "Exchange",
-                "verifyingContract": "0x0000000000000000000000000000000000000000",
-                "version": "1",
-            },
-            "types": {
-                "Agent": [
-                    {"name": "source", "type": "string"},
-                    {"name": "connectionId", "type": "bytes32"},
-                ],
-                "EIP712Domain": [
-                    {"name": "name", "type": "string"},
-                    {"name": "version", "type": "string"},
-                    {"name": "chainId", "type": "uint256"},
-                    {"name": "verifyingContract", "type": "address"},
-                ],
-            },
-            "primaryType": "Agent",
-            "message": phantom_agent,
-        }
-        
-        # Encode and sign - using encode_structured_data as the SDK does
-        try:
-            encoded_message = encode_structured_data(structured_data)
-        except Exception as e:
-            logger.error(f"Failed to encode structured data: {e}")
-            logger.error(f"connectionId type: {type(phantom_agent['connectionId'])}")
-            raise
-        
-        # Sign the encoded message
-        signed = self.account.sign_message(encoded_message)
+        # EIP-712 digest over the phantom agent {"source": "a", connectionId}
+        # using the precomputed domain separator and type hashes - same
+        # signature as encode_structured_data without rebuilding the typed
+        # data dict per order
+        self._struct_buf[64:96] = connection_id
+        self._digest_buf[34:66] = keccak256(bytes(self._struct_buf))
+        digest = keccak256(bytes(self._digest_buf))
+        signed = self._sign_digest(digest)
         
         # Extract signature using to_hex as the SDK does
-        # This ensures proper formatting
+        # This ensures proper formatting (raw signer yields v in {0,1})
         signature = {
-            "r": to_hex(signed["r"]),
-            "s": to_hex(signed["s"]),
-            "v": signed["v"]
+            "r": to_hex(signed.r),
+            "s": to_hex(signed.s),
+            "v": signed.v + 27
         }
         
         # Build final request - ALWAYS include vaultAddress (even if None) as SDK does
@@ -158,11 +264,47 @@ class TradeExecutor:
             "vaultAddress": vault_address  # SDK always includes this, even if None
         }
         
-        logger.debug(f"Signed request: {json.dumps(request_data, indent=2, default=str)}")
+        logger.opt(lazy=True).debug(
+            "Signed request: {payload}",
+            payload=lambda: json.dumps(request_data, default=str)
+        )
         return request_data
     
+    async def _load_meta(self):
+        """Fetch the meta universe once and index it by symbol name"""
+        session = await self._get_session()
+        async with session.post(
+            self.info_url,
+            json={"type": "meta"},
+            headers={"Content-Type": "application/json"}
+        ) as response:
+            if response.status == 200:
+                data = orjson.loads(await response.read())
+                self._asset_cache = {
+                    asset_info.get("name"): {
+                        "index": i,
+                        "szDecimals": asset_info.get("szDecimals", 5)
+                    }
+                    for i, asset_info in enumerate(data.get("universe", []))
+                }
+                self._asset_cache_ts = time.time()
+    
+    async def refresh_meta(self):
+        """Force-refresh the asset metadata cache (e.g. after a new listing)"""
+        async with self._meta_lock:
+            await self._load_meta()
+    
+    async def prime(self):
+        """Pre-warm the asset metadata cache at startup
+        
+        Keeps the first cancel/order off the /info critical path - with a
+        warm cache, every submit is a single signed POST.
+        """
+        await self.refresh_meta()
+        logger.info(f"Asset metadata primed: {len(self._asset_cache)} assets")
+    
     async def _get_asset_info(self, symbol: str) -> dict:
-        """Get asset info for a symbol from Hyperliquid meta API
+        """Get asset info for a symbol from the TTL-cached meta universe
         
         Args:
             symbol: Trading symbol (e.g. "BTC")
@@ -170,21 +312,20 @@ class TradeExecutor:
         Returns:
             Dict with asset index and szDecimals
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self.info_url,
-                json={"type": "meta"},
-                headers={"Content-Type": "application/json"}
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    for i, asset_info in enumerate(data.get("universe", [])):
-                        if asset_info.get("name") == symbol:
-                            return {
-                                "index": i,
-                                "szDecimals": asset_info.get("szDecimals", 5)
-                            }
-        raise ValueError(f"Asset {symbol} not found")
+        if time.time() - self._asset_cache_ts > self._meta_ttl:
+            async with self._meta_lock:
+                # Re-check after acquiring: another task may have refreshed
+                if time.time() - self._asset_cache_ts > self._meta_ttl:
+                    await self._load_meta()
+        
+        info = self._asset_cache.get(symbol)
+        if info is None:
+            # Symbol may have listed since the last refresh
+            await self.refresh_meta()
+            info = self._asset_cache.get(symbol)
+        if info is None:
+            raise ValueError(f"Asset {symbol} not found")
+        return info
     
     async def _get_asset_index(self, symbol: str) -> int:
         """Get asset index for a symbol from Hyperliquid meta API
@@ -199,7 +340,7 @@ class TradeExecutor:
         return info["index"]
     
     async def _get_mid_price(self, symbol: str) -> float:
-        """Get current mid price for a symbol
+        """Get current mid price for a symbol, cached for a short TTL
         
         Args:
             symbol: Trading symbol (e.g. "BTC")
@@ -207,41 +348,67 @@ class TradeExecutor:
         Returns:
             Current mid price
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self.info_url,
-                json={"type": "allMids"},
-                headers={"Content-Type": "application/json"}
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    if symbol in data:
-                        return float(data[symbol])
+        cached = self._mid_cache.get(symbol)
+        now = time.monotonic()
+        if cached and now - cached[1] < self._mid_ttl:
+            return cached[0]
+        
+        session = await self._get_session()
+        async with session.post(
+            self.info_url,
+            json={"type": "allMids"},
+            headers={"Content-Type": "application/json"}
+        ) as response:
+            if response.status == 200:
+                data = orjson.loads(await response.read())
+                if symbol in data:
+                    price = float(data[symbol])
+                    self._mid_cache[symbol] = (price, now)
+                    return price
         raise ValueError(f"Could not get price for {symbol}")
     
-    async def get_account_balance(self) -> float:
-        """Get your wallet's account balance from Hyperliquid
+    async def _get_clearinghouse_state(self) -> dict:
+        """Get your clearinghouseState payload, cached for a short TTL
         
-        Returns:
-            Account balance in USD
+        Balance and position accessors extract different fields from the
+        identical response, so consecutive calls share one fetch. The lock
+        coalesces concurrent refreshes.
         """
         if not self.wallet_address:
             raise ValueError("No wallet address configured")
         
-        async with aiohttp.ClientSession() as session:
+        if time.monotonic() - self._chs_cache_ts < self._chs_ttl and self._chs_cache is not None:
+            return self._chs_cache
+        
+        async with self._chs_lock:
+            # Re-check after acquiring: another task may have refreshed
+            if time.monotonic() - self._chs_cache_ts < self._chs_ttl and self._chs_cache is not None:
+                return self._chs_cache
+            
+            session = await self._get_session()
             async with session.post(
                 self.info_url,
                 json={"type": "clearinghouseState", "user": self.wallet_address},
                 headers={"Content-Type": "application/json"}
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    # Get withdrawable balance (available margin)
-                    margin_summary = data.get("marginSummary", {})
-                    account_value = float(margin_summary.get("accountValue", 0))
-                    logger.debug(f"Your wallet balance: ${account_value:.2f}")
-                    return account_value
-        raise ValueError("Could not get account balance")
+                    self._chs_cache = orjson.loads(await response.read())
+                    self._chs_cache_ts = time.monotonic()
+                    return self._chs_cache
+        raise ValueError("Could not get clearinghouse state")
+    
+    async def get_account_balance(self) -> float:
+        """Get your wallet's account balance from Hyperliquid
+        
+        Returns:
+            Account balance in USD
+        """
+        data = await self._get_clearinghouse_state()
+        # Get withdrawable balance (available margin)
+        margin_summary = data.get("marginSummary", {})
+        account_value = float(margin_summary.get("accountValue", 0))
+        logger.debug(f"Your wallet balance: ${account_value:.2f}")
+        return account_value
     
     async def get_my_positions(self) -> Dict[str, Dict[str, Any]]:
         """Get YOUR wallet's current positions from Hyperliquid
@@ -249,73 +416,40 @@ class TradeExecutor:
         Returns:
             Dict mapping symbol to position info: {size, side, entry_price, leverage}
         """
-        if not self.wallet_address:
-            raise ValueError("No wallet address configured")
-        
         positions = {}
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self.info_url,
-                json={"type": "clearinghouseState", "user": self.wallet_address},
-                headers={"Content-Type": "application/json"}
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    asset_positions = data.get("assetPositions", [])
-                    
-                    for ap in asset_positions:
-                        pos = ap.get("position", {})
-                        coin = pos.get("coin", "")
-                        szi = float(pos.get("szi", 0))
-                        
-                        if abs(szi) > 0 and coin:
-                            positions[coin] = {
-                                "size": abs(szi),
-                                "side": "LONG" if szi > 0 else "SHORT",
-                                "signed_size": szi,
-                                "entry_price": float(pos.get("entryPx", 0)),
-                                "leverage": float(pos.get("leverage", {}).get("value", 1))
-                            }
-                            logger.debug(f"Your position: {coin} {positions[coin]}")
-                    
-                    return positions
-        raise ValueError("Could not get positions")
+        data = await self._get_clearinghouse_state()
+        asset_positions = data.get("assetPositions", [])
+
+        for ap in asset_positions:
+            pos = ap.get("position", {})
+            coin = pos.get("coin", "")
+            szi = float(pos.get("szi", 0))
+
+            if abs(szi) > 0 and coin:
+                positions[coin] = {
+                    "size": abs(szi),
+                    "side": "LONG" if szi > 0 else "SHORT",
+                    "signed_size": szi,
+                    "entry_price": float(pos.get("entryPx", 0)),
+                    "leverage": float(pos.get("leverage", {}).get("value", 1))
+                }
+                logger.debug(f"Your position: {coin} {positions[coin]}")
+
+        return positions
     
     def _format_size(self, size: float, sz_decimals: int = 5) -> str:
         """Format size with appropriate decimal places for Hyperliquid
         
-        Args:
-            size: Order size
-            sz_decimals: Number of decimal places allowed for this asset
-            
-        Returns:
-            Formatted size string
+        Thin wrapper over the _fastfmt kernel (numba-compiled when available).
         """
-        if size == 0:
-            return "0"
-        
-        # Round to the exact number of decimal places allowed
-        rounded = round(size, sz_decimals)
-        
-        # Format with exact decimal places then strip trailing zeros
-        formatted = f"{rounded:.{sz_decimals}f}".rstrip('0').rstrip('.')
-        return formatted
+        return format_size(size, sz_decimals)
     
     def _calculate_slippage_price(self, price: float, is_buy: bool, slippage: float = 0.03) -> str:
         """Calculate price with slippage for market orders
         
-        Args:
-            price: Current market price
-            is_buy: True for buy orders, False for sell
-            slippage: Slippage percentage (default 3%)
-            
-        Returns:
-            Price string with slippage applied
+        Thin wrapper over the _fastfmt kernel (numba-compiled when available).
         """
-        # Apply slippage: higher price for buys, lower for sells
-        slippage_price = price * (1 + slippage) if is_buy else price * (1 - slippage)
-        # Round to 5 significant figures
-        return f"{slippage_price:.5g}"
+        return slippage_price(price, is_buy, slippage)
     
     async def _update_leverage(
         self,
@@ -347,28 +481,28 @@ class TradeExecutor:
             
             signed_action = self._sign_action(action)
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.exchange_url,
-                    json=signed_action,
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-                    if response.status == 200:
-                        try:
-                            result = await response.json()
-                            logger.debug(f"Response: {json.dumps(result, indent=2)}")
-                            logger.success(f"✅ Updated leverage for {symbol} to {leverage}x")
-                            return True
-                        except Exception as e:
-                            response_text = await response.text()
-                            logger.debug(f"Response text: {response_text}")
-                        logger.success(f"✅ Updated leverage for {symbol} to {leverage}x")
-                        return True
-                    else:
-                        response_text = await response.text()
-                        logger.error(f"Failed to update leverage: Status {response.status}")
-                        logger.error(f"Response: {response_text}")
-                        return False
+            session = await self._get_session()
+            async with session.post(
+                self.exchange_url,
+                json=signed_action,
+                headers={"Content-Type": "application/json"}
+            ) as response:
+                # Read the body exactly once - calling text() after a failed
+                # json() re-consumed an already-drained stream
+                body = await response.read()
+                if response.status != 200:
+                    logger.error(f"Failed to update leverage: Status {response.status}")
+                    logger.error(f"Response: {body[:200]!r}")
+                    return False
+
+                try:
+                    result = orjson.loads(body)
+                    logger.debug(f"Response: {result}")
+                except Exception:
+                    logger.debug(f"Non-JSON response: {body!r}")
+
+                logger.success(f"✅ Updated leverage for {symbol} to {leverage}x")
+                return True
                         
         except Exception as e:
             logger.error(f"Error updating leverage: {e}")
@@ -378,7 +512,7 @@ class TradeExecutor:
         self,
         symbol: str,
         side: OrderSide,
-        size: Decimal,
+        size: float,
         leverage: int = 1,
         reduce_only: bool = False
     ) -> Optional[str]:
@@ -404,25 +538,26 @@ class TradeExecutor:
             )
         
         try:
-            # Update leverage first if needed
+            # Asset info, mid price and the optional leverage update are
+            # independent - issue them concurrently so pre-submit latency is
+            # max-of-three instead of sum-of-three
+            coros = [self._get_asset_info(symbol), self._get_mid_price(symbol)]
             if leverage > 1:
-                await self._update_leverage(symbol, leverage)
-            
-            # Get asset info - includes index and szDecimals
-            asset_info = await self._get_asset_info(symbol)
+                coros.append(self._update_leverage(symbol, leverage))
+            results = await asyncio.gather(*coros)
+            asset_info, mid_price = results[0], results[1]
             asset_index = asset_info["index"]
             sz_decimals = asset_info["szDecimals"]
             
-            # Get current price and apply slippage for market order
+            # Apply slippage for market order
             # Hyperliquid uses IOC limit orders with slippage for "market" orders
             is_buy = side == OrderSide.BUY
-            mid_price = await self._get_mid_price(symbol)
             slippage_price = self._calculate_slippage_price(mid_price, is_buy)
             logger.debug(f"Market order: mid={mid_price}, slippage_price={slippage_price}, is_buy={is_buy}")
             
             # Create market order action (SDK format)
             # "a" = asset index (int), "b" = is_buy, "p" = price with slippage, "s" = size, "r" = reduce_only, "t" = order type
-            formatted_size = self._format_size(float(size), sz_decimals)
+            formatted_size = self._format_size(size, sz_decimals)
             action = {
                 "type": "order",
                 "orders": [{
@@ -431,56 +566,60 @@ class TradeExecutor:
                     "p": slippage_price,  # Price with slippage applied
                     "s": formatted_size,
                     "r": reduce_only,
-                    "t": {"limit": {"tif": "Ioc"}}  # Immediate or Cancel
+                    "t": self._TIF_IOC  # Immediate or Cancel
                 }],
                 "grouping": "na"
             }
             
             signed_action = self._sign_action(action)
             
-            # Log the request payload for debugging/auditing
-            logger.info(f"🔍 MARKET ORDER REQUEST PAYLOAD:\n{json.dumps(signed_action, indent=2, default=str)}")
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.exchange_url,
-                    json=signed_action,
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-                    response_text = await response.text()
-                    logger.info(f"🔍 MARKET ORDER RESPONSE [{response.status}]: {response_text}")
+            # Log the request payload for debugging/auditing - lazy so the
+            # JSON dump is only built when DEBUG is actually enabled
+            logger.opt(lazy=True).debug(
+                "🔍 MARKET ORDER REQUEST PAYLOAD: {payload}",
+                payload=lambda: json.dumps(signed_action, default=str)
+            )
+            
+            session = await self._get_session()
+            async with session.post(
+                self.exchange_url,
+                json=signed_action,
+                headers={"Content-Type": "application/json"}
+            ) as response:
+                response_text = await response.text()
+                logger.info(f"🔍 MARKET ORDER RESPONSE [{response.status}]: {response_text}")
                     
-                    if response.status == 200:
-                        try:
-                            result = json.loads(response_text)
-                            if result.get("status") == "ok":
-                                # Check for errors in statuses array
-                                statuses = result.get("response", {}).get("data", {}).get("statuses", [])
-                                if statuses and "error" in statuses[0]:
-                                    error_msg = statuses[0]["error"]
-                                    logger.error(f"Order failed: {error_msg}")
-                                    return None
-                                
-                                logger.success(
-                                    f"✅ Market {side.value} order executed: {symbol} "
-                                    f"size={formatted_size} leverage={leverage}x"
-                                )
-                                # Extract order ID or filled status
-                                if statuses:
-                                    if "resting" in statuses[0]:
-                                        return statuses[0]["resting"].get("oid")
-                                    elif "filled" in statuses[0]:
-                                        return "filled"
-                                return "executed"  # Order executed
-                            else:
-                                logger.error(f"Order rejected: {result}")
+                if response.status == 200:
+                    try:
+                        result = orjson.loads(response_text)
+                        if result.get("status") == "ok":
+                            # Check for errors in statuses array
+                            statuses = result.get("response", {}).get("data", {}).get("statuses", [])
+                            if statuses and "error" in statuses[0]:
+                                error_msg = statuses[0]["error"]
+                                logger.error(f"Order failed: {error_msg}")
                                 return None
-                        except json.JSONDecodeError:
-                            logger.error(f"Failed to parse response: {response_text}")
+                                
+                            logger.success(
+                                f"✅ Market {side.value} order executed: {symbol} "
+                                f"size={formatted_size} leverage={leverage}x"
+                            )
+                            # Extract order ID or filled status
+                            if statuses:
+                                if "resting" in statuses[0]:
+                                    return statuses[0]["resting"].get("oid")
+                                elif "filled" in statuses[0]:
+                                    return "filled"
+                            return "executed"  # Order executed
+                        else:
+                            logger.error(f"Order rejected: {result}")
                             return None
-                    else:
-                        logger.error(f"Failed to execute market order: {response_text}")
+                    except orjson.JSONDecodeError:
+                        logger.error(f"Failed to parse response: {response_text}")
                         return None
+                else:
+                    logger.error(f"Failed to execute market order: {response_text}")
+                    return None
                         
         except Exception as e:
             logger.error(f"Error executing market order: {e}")
@@ -490,8 +629,8 @@ class TradeExecutor:
         self,
         symbol: str,
         side: OrderSide,
-        size: Decimal,
-        price: Decimal,
+        size: float,
+        price: float,
         leverage: int = 1,
         reduce_only: bool = False,
         post_only: bool = False
@@ -521,55 +660,58 @@ class TradeExecutor:
             )
         
         try:
-            # Update leverage first if needed
+            # Leverage update and asset-info fetch are independent - run
+            # them concurrently
             if leverage > 1:
-                await self._update_leverage(symbol, leverage)
-            
-            # Get asset info - includes index and szDecimals
-            asset_info = await self._get_asset_info(symbol)
+                asset_info, _ = await asyncio.gather(
+                    self._get_asset_info(symbol),
+                    self._update_leverage(symbol, leverage)
+                )
+            else:
+                asset_info = await self._get_asset_info(symbol)
             asset_index = asset_info["index"]
             sz_decimals = asset_info["szDecimals"]
             
             # Create limit order action (SDK format)
-            tif = "Alo" if post_only else "Gtc"  # Alo = Add Liquidity Only, Gtc = Good Till Cancel
-            formatted_size = self._format_size(float(size), sz_decimals)
+            tif = self._TIF_ALO if post_only else self._TIF_GTC  # Alo = Add Liquidity Only, Gtc = Good Till Cancel
+            formatted_size = self._format_size(size, sz_decimals)
             
             action = {
                 "type": "order",
                 "orders": [{
                     "a": asset_index,
                     "b": side == OrderSide.BUY,
-                    "p": str(float(price)),
+                    "p": str(price),
                     "s": formatted_size,
                     "r": reduce_only,
-                    "t": {"limit": {"tif": tif}}
+                    "t": tif
                 }],
                 "grouping": "na"
             }
             
             signed_action = self._sign_action(action)
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.exchange_url,
-                    json=signed_action,
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        logger.success(
-                            f"✅ Limit {side.value} order placed: {symbol} "
-                            f"size={size} price={price} leverage={leverage}x"
-                        )
-                        # Extract order ID from response
-                        if result.get("status") == "ok" and result.get("response", {}).get("data"):
-                            order_id = result["response"]["data"].get("statuses", [{}])[0].get("resting", {}).get("oid")
-                            return order_id
-                        return None
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Failed to place limit order: {error_text}")
-                        return None
+            session = await self._get_session()
+            async with session.post(
+                self.exchange_url,
+                json=signed_action,
+                headers={"Content-Type": "application/json"}
+            ) as response:
+                if response.status == 200:
+                    result = orjson.loads(await response.read())
+                    logger.success(
+                        f"✅ Limit {side.value} order placed: {symbol} "
+                        f"size={size} price={price} leverage={leverage}x"
+                    )
+                    # Extract order ID from response
+                    if result.get("status") == "ok" and result.get("response", {}).get("data"):
+                        order_id = result["response"]["data"].get("statuses", [{}])[0].get("resting", {}).get("oid")
+                        return order_id
+                    return None
+                else:
+                    error_text = await response.text()
+                    logger.error(f"Failed to place limit order: {error_text}")
+                    return None
                         
         except Exception as e:
             logger.error(f"Error placing limit order: {e}")
@@ -579,7 +721,7 @@ class TradeExecutor:
         self,
         symbol: str,
         side: OrderSide,
-        size: Decimal,
+        size: float,
         trigger_price: float,
         is_take_profit: bool = False,
         is_market: bool = True,
@@ -612,7 +754,7 @@ class TradeExecutor:
             asset_index = asset_info["index"]
             sz_decimals = asset_info["szDecimals"]
             
-            formatted_size = self._format_size(float(size), sz_decimals)
+            formatted_size = self._format_size(size, sz_decimals)
             is_buy = side == OrderSide.BUY
             
             # For trigger orders, limit_px is the trigger price if market, or limit price if limit
@@ -640,7 +782,7 @@ class TradeExecutor:
                     "t": {
                         "trigger": {
                             "isMarket": False,  # Always use trigger limit orders
-                            "triggerPx": f"{trigger_price:.5g}",  # .5g enforces max 5 sig figs
+                            "triggerPx": fmt5g(trigger_price),  # enforces max 5 sig figs
                             "tpsl": tpsl
                         }
                     }
@@ -651,39 +793,43 @@ class TradeExecutor:
             signed_action = self._sign_action(action)
             
             order_type = "TP" if is_take_profit else "SL"
-            logger.info(f"🔍 {order_type} ORDER REQUEST:\n{json.dumps(signed_action, indent=2, default=str)}")
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.exchange_url,
-                    json=signed_action,
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-                    response_text = await response.text()
-                    logger.info(f"🔍 {order_type} ORDER RESPONSE [{response.status}]: {response_text}")
+            logger.opt(lazy=True).debug(
+                "🔍 {ot} ORDER REQUEST: {payload}",
+                ot=lambda: order_type,
+                payload=lambda: json.dumps(signed_action, default=str)
+            )
+            
+            session = await self._get_session()
+            async with session.post(
+                self.exchange_url,
+                json=signed_action,
+                headers={"Content-Type": "application/json"}
+            ) as response:
+                response_text = await response.text()
+                logger.info(f"🔍 {order_type} ORDER RESPONSE [{response.status}]: {response_text}")
                     
-                    if response.status == 200:
-                        try:
-                            result = json.loads(response_text)
-                            if result.get("status") == "ok":
-                                statuses = result.get("response", {}).get("data", {}).get("statuses", [])
-                                if statuses and "resting" in statuses[0]:
-                                    order_id = statuses[0]["resting"]["oid"]
-                                    logger.success(f"✅ {order_type} order placed: {symbol} trigger @ ${trigger_price}")
-                                    return str(order_id)
-                                elif statuses and "error" in statuses[0]:
-                                    logger.error(f"{order_type} order failed: {statuses[0]['error']}")
-                                    return None
-                            else:
-                                logger.error(f"{order_type} order failed: {result}")
+                if response.status == 200:
+                    try:
+                        result = orjson.loads(response_text)
+                        if result.get("status") == "ok":
+                            statuses = result.get("response", {}).get("data", {}).get("statuses", [])
+                            if statuses and "resting" in statuses[0]:
+                                order_id = statuses[0]["resting"]["oid"]
+                                logger.success(f"✅ {order_type} order placed: {symbol} trigger @ ${trigger_price}")
+                                return str(order_id)
+                            elif statuses and "error" in statuses[0]:
+                                logger.error(f"{order_type} order failed: {statuses[0]['error']}")
                                 return None
-                        except Exception as e:
-                            logger.error(f"Error parsing {order_type} order response: {e}")
+                        else:
+                            logger.error(f"{order_type} order failed: {result}")
                             return None
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Failed to place {order_type} order: {error_text}")
+                    except Exception as e:
+                        logger.error(f"Error parsing {order_type} order response: {e}")
                         return None
+                else:
+                    error_text = await response.text()
+                    logger.error(f"Failed to place {order_type} order: {error_text}")
+                    return None
                         
         except Exception as e:
             logger.error(f"Error placing trigger order: {e}")
@@ -692,7 +838,7 @@ class TradeExecutor:
     async def close_position(
         self,
         symbol: str,
-        size: Decimal,
+        size: float,
         side: OrderSide
     ) -> Optional[str]:
         """Close a position using a market order
@@ -734,47 +880,92 @@ class TradeExecutor:
             # Get asset index - Hyperliquid requires integer asset index!
             asset_index = await self._get_asset_index(symbol)
             
-            # Cancel action format (SDK format)
+            # Reuse the cancel template (SDK action format); serialize
+            # before the next await so the shared dict can't be clobbered
+            entry = self._cancel_template["cancels"][0]
+            entry["a"] = asset_index
+            entry["o"] = int(order_id)
+            
+            payload = orjson.dumps(self._sign_action(self._cancel_template))
+            
+            session = await self._get_session()
+            async with session.post(
+                self.exchange_url,
+                data=payload,
+                headers={"Content-Type": "application/json"}
+            ) as response:
+                if response.status == 200:
+                    logger.success(f"✅ Cancelled order {order_id} for {symbol}")
+                    return True
+                else:
+                    error_text = await response.text()
+                    logger.error(f"Failed to cancel order: {error_text}")
+                    return False
+                        
+        except Exception as e:
+            logger.error(f"Error cancelling order: {e}")
+            return False
+    
+    async def cancel_orders(self, pairs: list) -> bool:
+        """Cancel a batch of orders in a single exchange request
+        
+        Wallet-wide exits cancel many orders at once; Hyperliquid's cancel
+        action takes a list, so one signed POST replaces N round-trips.
+        
+        Args:
+            pairs: List of (symbol, order_id) tuples to cancel
+            
+        Returns:
+            True if the batch was accepted, False otherwise
+        """
+        if not pairs:
+            return True
+        
+        if self.dry_run:
+            logger.info(f"🔵 DRY RUN: Would cancel {len(pairs)} orders")
+            return True
+        
+        try:
             action = {
                 "type": "cancel",
-                "cancels": [{
-                    "a": asset_index,
-                    "o": int(order_id)
-                }]
+                "cancels": [
+                    {"a": await self._get_asset_index(symbol), "o": int(order_id)}
+                    for symbol, order_id in pairs
+                ]
             }
             
-            signed_action = self._sign_action(action)
+            payload = orjson.dumps(self._sign_action(action))
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.exchange_url,
-                    json=signed_action,
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-                    if response.status == 200:
-                        logger.success(f"✅ Cancelled order {order_id} for {symbol}")
-                        return True
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Failed to cancel order: {error_text}")
-                        return False
+            session = await self._get_session()
+            async with session.post(
+                self.exchange_url,
+                data=payload,
+                headers={"Content-Type": "application/json"}
+            ) as response:
+                if response.status == 200:
+                    logger.success(f"✅ Cancelled {len(pairs)} orders in one batch")
+                    return True
+                else:
+                    error_text = await response.text()
+                    logger.error(f"Failed to cancel order batch: {error_text}")
+                    return False
                         
         except Exception as e:
-            logger.error(f"Error cancelling order: {e}")
+            logger.error(f"Error cancelling order batch: {e}")
             return False
     
-    async def cancel_all_orders(self, symbol: Optional[str] = None) -> int:
+    async def cancel_all_orders(self, symbol: Optional[str] = None) -> bool:
         """Cancel all orders
         
         Args:
             symbol: If provided, cancel only orders for this symbol
             
         Returns:
-            Number of orders cancelled
+            True if the request was accepted, False otherwise
         """
         if self.dry_run:
             logger.info(f"🔵 DRY RUN: Would cancel all orders{f' for {symbol}' if symbol else ''}")
-            return 0
+            return True
         
         try:
             action = {
@@ -787,33 +978,41 @@ class TradeExecutor:
             
             signed_action = self._sign_action(action)
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.exchange_url,
-                    json=signed_action,
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        count = len(result.get("response", {}).get("data", {}).get("statuses", []))
-                        logger.success(f"✅ Cancelled {count} orders{f' for {symbol}' if symbol else ''}")
-                        return count
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Failed to cancel all orders: {error_text}")
-                        return 0
+            session = await self._get_session()
+            async with session.post(
+                self.exchange_url,
+                json=signed_action,
+                headers={"Content-Type": "application/json"}
+            ) as response:
+                if response.status == 200:
+                    # Only the status matters on the happy path - parse
+                    # the body lazily for the DEBUG count, not eagerly
+                    body = await response.read()
+                    logger.opt(lazy=True).debug(
+                        "Cancelled {count} orders{suffix}",
+                        count=lambda: len(
+                            orjson.loads(body).get("response", {}).get("data", {}).get("statuses", [])
+                        ),
+                        suffix=lambda: f" for {symbol}" if symbol else ""
+                    )
+                    logger.success(f"✅ Cancel-all accepted{f' for {symbol}' if symbol else ''}")
+                    return True
+                else:
+                    error_text = await response.text()
+                    logger.error(f"Failed to cancel all orders: {error_text}")
+                    return False
                         
         except Exception as e:
             logger.error(f"Error cancelling all orders: {e}")
-            return 0
+            return False
     
     async def _simulate_order(
         self,
         symbol: str,
         side: OrderSide,
-        size: Decimal,
+        size: float,
         order_type: OrderType,
-        price: Optional[Decimal] = None,
+        price: Optional[float] = None,
         leverage: int = 1
     ) -> str:
         """Simulate an order without executing
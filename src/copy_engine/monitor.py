@@ -1,9 +1,10 @@
 import asyncio
+import time
 from typing import Callable, Optional, List
 from loguru import logger
 from hyperliquid.client import HyperliquidClient
 from hyperliquid.websocket import HyperliquidWebSocket
-from hyperliquid.models import Position, Order, UserState, WebSocketUpdate
+from hyperliquid.models import Position, Order, UserState, WebSocketUpdate, PositionSide, OrderSide
 from config.settings import settings
 
 class WalletMonitor:
@@ -15,42 +16,83 @@ class WalletMonitor:
         self,
         target_address: str,
         api_url: str = "https://api.hyperliquid.xyz",
-        ws_url: str = "wss://api.hyperliquid.xyz/ws"
+        ws_url: str = "wss://api.hyperliquid.xyz/ws",
+        session=None
     ):
         self.target_address = target_address
-        self.client = HyperliquidClient(api_url)
+        self.client = HyperliquidClient(api_url, session=session)
         self.ws = HyperliquidWebSocket(ws_url)
         
         # Current state tracking
         self.current_state: Optional[UserState] = None
         self.last_positions: List[Position] = []
         self.last_orders: List[Order] = []
+        # Symbol/oid indexes over the lists above - updates arrive per
+        # position/order, so lookups must be O(1) instead of a linear scan
+        self.last_positions_by_symbol: dict = {}
+        self.last_orders_by_id: dict = {}
         
-        # Callbacks
-        self.on_new_position: Optional[Callable] = None
-        self.on_position_update: Optional[Callable] = None
-        self.on_position_close: Optional[Callable] = None
-        self.on_new_order: Optional[Callable] = None
-        self.on_order_fill: Optional[Callable] = None
-        self.on_order_cancel: Optional[Callable] = None
+        # Monotonic version bumped on every state change - consumers can
+        # key render caches off it instead of re-deriving from the lists
+        self.state_version = 0
+        
+        # Background REST reconciliation debounce - WS handlers merge
+        # updates locally and only periodically re-sync the full state
+        self._reconcile_interval = 30.0
+        self._last_reconcile = 0.0
+        self._reconcile_pending = False
+        self._reconcile_task = None  # strong ref so the task can't be GC'd
+        
+        # Callbacks - assigned through properties that resolve sync vs
+        # async once at assignment time instead of per event
+        self.on_new_position = None
+        self.on_position_update = None
+        self.on_position_close = None
+        self.on_new_order = None
+        self.on_order_fill = None
+        self.on_order_cancel = None
+        # Sync hook fired after every full state refresh (not wrapped -
+        # called inline with the fresh UserState)
+        self.on_state_refresh = None
+        
+        # Snapshot of the blocked-assets frozenset - handlers check it on
+        # every fill/position event, so skip the settings attribute chain
+        self._blocked_assets = settings.copy_rules.blocked_assets
         
         logger.info(f"Wallet Monitor initialized for {target_address}")
     
     async def get_current_state(self) -> Optional[UserState]:
-        """Fetch current state of target wallet"""
-        async with self.client:
-            self.current_state = await self.client.get_user_state(self.target_address)
-            
-            if self.current_state:
-                self.last_positions = self.current_state.positions.copy()
-                self.last_orders = self.current_state.orders.copy()
+        """Fetch current state of target wallet
+        
+        Uses the client's persistent session (opened for the monitoring
+        lifetime) instead of reconnecting per call - every position/order
+        update refreshes state, so per-call sessions meant one TLS
+        handshake per WebSocket event.
+        """
+        self.current_state = await self.client.get_user_state(self.target_address)
+        
+        if self.current_state:
+            self.last_positions = self.current_state.positions.copy()
+            self.last_orders = self.current_state.orders.copy()
+            self.last_positions_by_symbol = {p.symbol: p for p in self.last_positions}
+            self.last_orders_by_id = {o.order_id: o for o in self.last_orders}
+            self.state_version += 1
             
-            return self.current_state
+            if self.on_state_refresh:
+                try:
+                    self.on_state_refresh(self.current_state)
+                except Exception as e:
+                    logger.error(f"Error in state refresh hook: {e}")
+        
+        return self.current_state
     
     async def start_monitoring(self):
         """Start monitoring the target wallet"""
         logger.info(f"Starting monitoring for {self.target_address}")
         
+        # Open the shared REST session for the monitoring lifetime
+        await self.client.__aenter__()
+        
         # Get initial state
         await self.get_current_state()
         
@@ -67,6 +109,110 @@ class WalletMonitor:
         """Stop monitoring"""
         logger.info("Stopping wallet monitoring")
         await self.ws.stop()
+        await self.client.__aexit__(None, None, None)
+    
+    @property
+    def on_new_position(self) -> Optional[Callable]:
+        return self._on_new_position
+    
+    @on_new_position.setter
+    def on_new_position(self, callback: Optional[Callable]):
+        self._on_new_position = self._wrap_callback(callback)
+    
+    @property
+    def on_position_update(self) -> Optional[Callable]:
+        return self._on_position_update
+    
+    @on_position_update.setter
+    def on_position_update(self, callback: Optional[Callable]):
+        self._on_position_update = self._wrap_callback(callback)
+    
+    @property
+    def on_position_close(self) -> Optional[Callable]:
+        return self._on_position_close
+    
+    @on_position_close.setter
+    def on_position_close(self, callback: Optional[Callable]):
+        self._on_position_close = self._wrap_callback(callback)
+    
+    @property
+    def on_new_order(self) -> Optional[Callable]:
+        return self._on_new_order
+    
+    @on_new_order.setter
+    def on_new_order(self, callback: Optional[Callable]):
+        self._on_new_order = self._wrap_callback(callback)
+    
+    @property
+    def on_order_fill(self) -> Optional[Callable]:
+        return self._on_order_fill
+    
+    @on_order_fill.setter
+    def on_order_fill(self, callback: Optional[Callable]):
+        self._on_order_fill = self._wrap_callback(callback)
+    
+    @property
+    def on_order_cancel(self) -> Optional[Callable]:
+        return self._on_order_cancel
+    
+    @on_order_cancel.setter
+    def on_order_cancel(self, callback: Optional[Callable]):
+        self._on_order_cancel = self._wrap_callback(callback)
+    
+    @staticmethod
+    def _wrap_callback(callback: Optional[Callable]) -> Optional[Callable]:
+        """Normalize a callback to an awaitable-returning callable
+        
+        Coroutine-ness is resolved here, once at assignment, rather than
+        via introspection on every dispatched event. Sync callbacks are
+        wrapped to run in the default executor so they can't block the
+        WebSocket reader.
+        """
+        if callback is None or asyncio.iscoroutinefunction(callback):
+            return callback
+        
+        async def run_sync(payload, _callback=callback):
+            await asyncio.get_running_loop().run_in_executor(None, _callback, payload)
+        
+        return run_sync
+    
+    def _dispatch(self, callback: Callable, payload: dict, tasks: list):
+        """Queue a callback invocation for batched concurrent dispatch
+        
+        Async callbacks are gathered so K items cost max-latency instead
+        of sum-of-latencies. Callbacks arrive pre-normalized by
+        _wrap_callback, so this is a plain call.
+        """
+        tasks.append(callback(payload))
+    
+    async def _run_dispatched(self, tasks: list, what: str):
+        """Await queued callbacks concurrently, logging any failures"""
+        if not tasks:
+            return
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error in {what} callback: {result}")
+    
+    def _schedule_reconcile(self):
+        """Kick off a background full-state refresh, at most one at a time
+        and no more than once per reconcile interval"""
+        now = time.monotonic()
+        if self._reconcile_pending or now - self._last_reconcile < self._reconcile_interval:
+            return
+        self._reconcile_pending = True
+        # Keep a strong reference - a bare create_task result can be
+        # garbage-collected mid-flight, silently dropping the re-sync
+        self._reconcile_task = asyncio.create_task(self._reconcile())
+    
+    async def _reconcile(self):
+        try:
+            await self.get_current_state()
+            self._last_reconcile = time.monotonic()
+        except Exception as e:
+            logger.error(f"Error reconciling state: {e}")
+        finally:
+            self._reconcile_pending = False
     
     async def _handle_update(self, update: WebSocketUpdate):
         """Handle WebSocket updates from target wallet"""
@@ -95,10 +241,9 @@ class WalletMonitor:
                 logger.success(f"📋 ORDERS UPDATE: {len(data['orders'])} orders")
                 await self._handle_orders(data["orders"])
                 
-        except Exception as e:
-            logger.error(f"Error handling update: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+        except Exception:
+            # logger.exception captures the stack lazily at sink time
+            logger.exception("Error handling update")
     
     async def _handle_fills(self, fills: List[dict]):
         """Handle trade fills
@@ -117,7 +262,7 @@ class WalletMonitor:
             symbol = fill.get("coin", "").upper()
             
             # Check if asset is blocked
-            if symbol in settings.copy_rules.blocked_assets:
+            if symbol in self._blocked_assets:
                 logger.warning(f"⛔ BLOCKED ASSET - Ignoring fill for {symbol} (in blocked list)")
                 continue
             
@@ -134,8 +279,16 @@ class WalletMonitor:
                 fill_groups[None]["fills"].append(fill)
                 fill_groups[None]["total_size"] += abs(float(fill.get('sz', 0)))
         
-        # Process each order once with aggregated size
-        for oid, group in fill_groups.items():
+        # Process each order once with aggregated size. Closes and
+        # reduce-only (TP/SL) fills dispatch ahead of opens: under load a
+        # delayed close leaves an unhedged position, while a delayed open
+        # just misses some entry edge
+        def _priority(group):
+            first = group["fills"][0]
+            return 0 if "Close" in first.get("dir", "") else 1
+        
+        tasks = []
+        for oid, group in sorted(fill_groups.items(), key=lambda kv: _priority(kv[1])):
             if len(group["fills"]) > 1:
                 logger.info(f"📦 Aggregated {len(group['fills'])} partial fills for order {oid}: total size = {group['total_size']}")
             
@@ -144,13 +297,9 @@ class WalletMonitor:
             fill_data['sz'] = str(group["total_size"])  # Override with aggregated total
             
             if self.on_order_fill:
-                try:
-                    if asyncio.iscoroutinefunction(self.on_order_fill):
-                        await self.on_order_fill(fill_data)
-                    else:
-                        self.on_order_fill(fill_data)
-                except Exception as e:
-                    logger.error(f"Error in fill callback: {e}")
+                self._dispatch(self.on_order_fill, fill_data, tasks)
+        
+        await self._run_dispatched(tasks, "fill")
     
     async def _handle_positions(self, positions: List[dict]):
         """Handle position updates"""
@@ -158,83 +307,106 @@ class WalletMonitor:
         
         # from ..config.settings import settings
         
+        tasks = []
         for pos_data in positions:
             # Parse position data
             symbol = pos_data.get("coin", "").upper()
             size = float(pos_data.get("szi", 0))
             
             # Check if asset is blocked
-            if symbol in settings.copy_rules.blocked_assets:
+            if symbol in self._blocked_assets:
                 logger.debug(f"⛔ Ignoring position update for blocked asset: {symbol}")
                 continue
             
             # Check if this is a new position
-            existing = next((p for p in self.last_positions if p.symbol == symbol), None)
+            existing = self.last_positions_by_symbol.get(symbol)
             
             if not existing and size != 0:
                 # NEW POSITION!
                 logger.success(f"🆕 NEW POSITION DETECTED: {symbol}")
                 
                 if self.on_new_position:
-                    try:
-                        if asyncio.iscoroutinefunction(self.on_new_position):
-                            await self.on_new_position(pos_data)
-                        else:
-                            self.on_new_position(pos_data)
-                    except Exception as e:
-                        logger.error(f"Error in new position callback: {e}")
+                    self._dispatch(self.on_new_position, pos_data, tasks)
             
             elif existing and size == 0:
                 # POSITION CLOSED
                 logger.info(f"❌ POSITION CLOSED: {symbol}")
                 
                 if self.on_position_close:
-                    try:
-                        if asyncio.iscoroutinefunction(self.on_position_close):
-                            await self.on_position_close(pos_data)
-                        else:
-                            self.on_position_close(pos_data)
-                    except Exception as e:
-                        logger.error(f"Error in position close callback: {e}")
+                    # Hand the callback the pre-merge snapshot - the local
+                    # merge below evicts the symbol before dispatch runs,
+                    # so it's the only remaining source for exit pricing
+                    self._dispatch(
+                        self.on_position_close,
+                        dict(pos_data, closedPosition=existing),
+                        tasks
+                    )
             
             elif existing and abs(size) != abs(existing.size):
                 # POSITION SIZE CHANGED
                 logger.info(f"📊 POSITION UPDATED: {symbol} ({existing.size} -> {size})")
                 
                 if self.on_position_update:
-                    try:
-                        if asyncio.iscoroutinefunction(self.on_position_update):
-                            await self.on_position_update(pos_data)
-                        else:
-                            self.on_position_update(pos_data)
-                    except Exception as e:
-                        logger.error(f"Error in position update callback: {e}")
-        
-        # Update state
-        await self.get_current_state()
+                    self._dispatch(self.on_position_update, pos_data, tasks)
+            
+            # Merge the update into local state - the WS payload is the
+            # same data a clearinghouseState re-fetch would return for
+            # this position, so don't pay a REST round-trip per event
+            if size == 0:
+                self.last_positions_by_symbol.pop(symbol, None)
+            else:
+                position_info = pos_data.get("position", {})
+                entry_price = float(position_info.get("entryPx") or 0)
+                self.last_positions_by_symbol[symbol] = Position(
+                    symbol=symbol,
+                    side=PositionSide.LONG if size > 0 else PositionSide.SHORT,
+                    size=abs(size),
+                    entry_price=entry_price,
+                    current_price=entry_price,
+                    leverage=float(position_info.get("leverage", {}).get("value", 1)),
+                    unrealized_pnl=float(position_info.get("unrealizedPnl") or 0)
+                )
+        
+        self.last_positions = list(self.last_positions_by_symbol.values())
+        self.state_version += 1
+        
+        await self._run_dispatched(tasks, "position")
+        
+        # Periodic background re-sync instead of a synchronous re-fetch
+        self._schedule_reconcile()
     
     async def _handle_orders(self, orders: List[dict]):
         """Handle order updates"""
         logger.info(f"📝 Order update received: {len(orders)} orders")
         
+        tasks = []
         for order_data in orders:
             order_id = str(order_data.get("oid", ""))
             symbol = order_data.get("coin", "")
             
             # Check if new order
-            existing = next((o for o in self.last_orders if o.order_id == order_id), None)
+            existing = self.last_orders_by_id.get(order_id)
             
             if not existing:
                 logger.success(f"📋 NEW ORDER: {symbol} - ID: {order_id}")
                 
                 if self.on_new_order:
-                    try:
-                        if asyncio.iscoroutinefunction(self.on_new_order):
-                            await self.on_new_order(order_data)
-                        else:
-                            self.on_new_order(order_data)
-                    except Exception as e:
-                        logger.error(f"Error in new order callback: {e}")
-        
-        # Update state
-        await self.get_current_state()
+                    self._dispatch(self.on_new_order, order_data, tasks)
+            
+            # Merge the order into local state
+            self.last_orders_by_id[order_id] = Order(
+                order_id=order_id,
+                symbol=symbol,
+                side=OrderSide.BUY if order_data.get("side") == "B" else OrderSide.SELL,
+                order_type=order_data.get("orderType", "limit").lower(),
+                size=float(order_data.get("sz") or 0),
+                price=float(order_data.get("limitPx") or 0) or None
+            )
+        
+        self.last_orders = list(self.last_orders_by_id.values())
+        self.state_version += 1
+        
+        await self._run_dispatched(tasks, "order")
+        
+        # Periodic background re-sync instead of a synchronous re-fetch
+        self._schedule_reconcile()
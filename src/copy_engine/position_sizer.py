@@ -88,34 +88,32 @@ class PositionSizer:
             Target opens: $5k position
             Your position: $5k * 0.01 = $50
         """
-        logger.info(f"🔍 POSITION_SIZER: Starting proportional size calculation")
-        logger.info(f"   Target Position: {target_position.size:.6f} {target_position.symbol} @ ${target_position.entry_price:,.2f}")
-        logger.info(f"   Target Wallet Balance: ${target_wallet_balance:,.2f}")
-        logger.info(f"   Your Wallet Balance: ${your_wallet_balance:,.2f}")
-        
         # Calculate target position notional value
         target_notional = target_position.size * target_position.entry_price
-        logger.info(f"   Target Position Notional: ${target_notional:,.2f}")
         
         # Calculate the ratio between wallets
         if target_wallet_balance > 0:
             wallet_ratio = your_wallet_balance / target_wallet_balance
-            logger.info(f"   Calculated Wallet Ratio: {wallet_ratio:.6f} (from balances)")
         else:
             wallet_ratio = self.portfolio_ratio
-            logger.warning(f"   Target balance is 0, using portfolio_ratio: {wallet_ratio:.6f}")
+            logger.warning(f"Target balance is 0, using portfolio_ratio: {wallet_ratio:.6f}")
         
         # Calculate your position size
         your_notional = target_notional * wallet_ratio
-        logger.info(f"   Your Position Notional: ${your_notional:,.2f} (${target_notional:,.2f} * {wallet_ratio:.6f})")
         
         # Convert back to size (coins)
         your_size = your_notional / target_position.entry_price if target_position.entry_price > 0 else 0
-        logger.info(f"   Your Position Size: {your_size:.6f} {target_position.symbol} (${your_notional:,.2f} / ${target_position.entry_price:,.2f})")
         
-        logger.info(
-            f"✅ Proportional sizing: Target ${target_notional:.2f} -> Your ${your_notional:.2f} "
-            f"({wallet_ratio:.4f} ratio) = {your_size:.4f} coins"
+        # One lazy structured entry instead of seven eager f-string logs -
+        # this runs per position event, so formatting only happens when
+        # the DEBUG sink is enabled
+        logger.opt(lazy=True).debug(
+            "Proportional sizing {symbol}: target ${target:,.2f} -> your ${yours:,.2f} ({ratio:.4f} ratio) = {size:.4f} coins",
+            symbol=lambda: target_position.symbol,
+            target=lambda: target_notional,
+            yours=lambda: your_notional,
+            ratio=lambda: wallet_ratio,
+            size=lambda: your_size
         )
         
         return your_size
@@ -180,14 +178,17 @@ class PositionSizer:
         if target_entry_price <= 0:
             return False
         
-        deviation_pct = abs(current_market_price - target_entry_price) / target_entry_price * 100
+        # Cross-multiplied comparison: skips the divide (and any string
+        # formatting) on the happy path that runs per position signal
+        diff_scaled = abs(current_market_price - target_entry_price) * 100.0
+        limit_scaled = max_entry_deviation_pct * target_entry_price
         
-        if deviation_pct > max_entry_deviation_pct:
+        if diff_scaled > limit_scaled:
+            deviation_pct = diff_scaled / target_entry_price
             logger.warning(
                 f"Entry quality check failed: Price moved {deviation_pct:.2f}% "
                 f"(max: {max_entry_deviation_pct:.2f}%)"
             )
             return False
         
-        logger.info(f"Entry quality OK: {deviation_pct:.2f}% deviation")
         return True
@@ -1,5 +1,6 @@
 import aiohttp
-import json
+import orjson
+from datetime import datetime
 from typing import Optional, List, Dict, Any
 from loguru import logger
 from .models import Position, Order, UserState, PositionSide, OrderSide
@@ -9,29 +10,61 @@ class HyperliquidClient:
     Client for interacting with Hyperliquid REST API
     """
     
-    def __init__(self, api_url: str = "https://api.hyperliquid.xyz"):
+    def __init__(
+        self,
+        api_url: str = "https://api.hyperliquid.xyz",
+        session: Optional[aiohttp.ClientSession] = None
+    ):
         self.api_url = api_url
         self.info_url = f"{api_url}/info"
         self.exchange_url = f"{api_url}/exchange"
-        self.session: Optional[aiohttp.ClientSession] = None
+        # An injected session is shared app-wide (one warm pool for every
+        # subsystem) and its lifecycle belongs to the caller
+        self.session = session
+        self._owns_session = session is None
+    
+    def _make_session(self) -> aiohttp.ClientSession:
+        """Build a session with a pool tuned for hammering one host
+        
+        Everything goes to /info and /exchange on the same host, so a
+        per-host keep-alive pool plus DNS cache avoids re-resolving and
+        re-connecting between calls.
+        """
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=16,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True
+            )
+        )
         
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        if not self.session or self.session.closed:
+            self.session = self._make_session()
+            self._owns_session = True
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
+            self.session = None
     
     async def _post(self, url: str, data: dict) -> dict:
         """Make POST request to API"""
-        if not self.session:
-            self.session = aiohttp.ClientSession()
+        if not self.session or self.session.closed:
+            self.session = self._make_session()
+            self._owns_session = True
             
         try:
-            async with self.session.post(url, json=data) as response:
+            async with self.session.post(
+                url,
+                data=orjson.dumps(data),
+                headers={"Content-Type": "application/json"}
+            ) as response:
                 response.raise_for_status()
-                return await response.json()
+                return orjson.loads(await response.read())
         except aiohttp.ClientError as e:
             logger.error(f"API request failed: {e}")
             raise
@@ -57,51 +90,61 @@ class HyperliquidClient:
             if not response:
                 return None
             
-            # Parse positions
+            # Parse in one tight pass - this runs on every monitor
+            # refresh, and whale wallets carry hundreds of entries, so
+            # bind lookups/conversions locally and hoist repeated .get
+            # chains out of the loops
+            _float = float
+            _long, _short = PositionSide.LONG, PositionSide.SHORT
+            _buy, _sell = OrderSide.BUY, OrderSide.SELL
+            
             positions = []
-            if "assetPositions" in response:
-                for pos_data in response["assetPositions"]:
-                    position = pos_data.get("position", {})
-                    if position and position.get("szi") != "0":  # szi is the position size
-                        size = float(position.get("szi", 0))
-                        side = PositionSide.LONG if size > 0 else PositionSide.SHORT
-                        
-                        # "coin" is inside the "position" object, not at top level
-                        positions.append(Position(
-                            symbol=position.get("coin", ""),
-                            side=side,
-                            size=abs(size),
-                            entry_price=float(position.get("entryPx", 0)),
-                            current_price=float(position.get("positionValue", 0)) / abs(size) if size != 0 else 0,
-                            leverage=float(position.get("leverage", {}).get("value", 1)),
-                            unrealized_pnl=float(position.get("unrealizedPnl", 0)),
-                            liquidation_price=float(position.get("liquidationPx")) if position.get("liquidationPx") else None,
-                            margin=float(position.get("marginUsed", 0))
-                        ))
+            append_position = positions.append
+            for pos_data in response.get("assetPositions", ()):
+                position = pos_data.get("position")
+                if not position or position.get("szi") == "0":
+                    continue
+                size = _float(position.get("szi", 0))
+                abs_size = -size if size < 0 else size
+                liquidation_px = position.get("liquidationPx")
+                
+                # "coin" is inside the "position" object, not at top level
+                append_position(Position(
+                    symbol=position.get("coin", ""),
+                    side=_long if size > 0 else _short,
+                    size=abs_size,
+                    entry_price=_float(position.get("entryPx", 0)),
+                    current_price=_float(position.get("positionValue", 0)) / abs_size if abs_size else 0,
+                    leverage=_float(position.get("leverage", {}).get("value", 1)),
+                    unrealized_pnl=_float(position.get("unrealizedPnl", 0)),
+                    liquidation_price=_float(liquidation_px) if liquidation_px else None,
+                    margin=_float(position.get("marginUsed", 0))
+                ))
             
-            # Parse orders
             orders = []
-            if "openOrders" in response:
-                for order_data in response["openOrders"]:
-                    order = order_data.get("order", {})
-                    orders.append(Order(
-                        order_id=str(order.get("oid", "")),
-                        symbol=order.get("coin", ""),
-                        side=OrderSide.BUY if order.get("side") == "B" else OrderSide.SELL,
-                        order_type=order.get("orderType", "limit").lower(),
-                        size=float(order.get("sz", 0)),
-                        price=float(order.get("limitPx", 0)) if order.get("limitPx") else None,
-                        filled_size=float(order.get("szFilled", 0)),
-                        status="open",
-                        trigger_price=float(order.get("triggerPx", 0)) if order.get("triggerPx") else None
-                    ))
+            append_order = orders.append
+            for order_data in response.get("openOrders", ()):
+                order = order_data.get("order", {})
+                limit_px = order.get("limitPx")
+                trigger_px = order.get("triggerPx")
+                append_order(Order(
+                    order_id=str(order.get("oid", "")),
+                    symbol=order.get("coin", ""),
+                    side=_buy if order.get("side") == "B" else _sell,
+                    order_type=order.get("orderType", "limit").lower(),
+                    size=_float(order.get("sz", 0)),
+                    price=_float(limit_px) if limit_px else None,
+                    filled_size=_float(order.get("szFilled", 0)),
+                    status="open",
+                    trigger_price=_float(trigger_px) if trigger_px else None
+                ))
             
             # Parse account balance
-            balance = float(response.get("marginSummary", {}).get("accountValue", 0))
-            margin_used = float(response.get("marginSummary", {}).get("totalMarginUsed", 0))
-            unrealized_pnl = float(response.get("marginSummary", {}).get("totalNtlPos", 0))
+            margin_summary = response.get("marginSummary", {})
+            balance = _float(margin_summary.get("accountValue", 0))
+            margin_used = _float(margin_summary.get("totalMarginUsed", 0))
+            unrealized_pnl = _float(margin_summary.get("totalNtlPos", 0))
             
-            from datetime import datetime
             return UserState(
                 address=address,
                 positions=positions,
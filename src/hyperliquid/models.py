@@ -17,7 +17,38 @@ class PositionSide(str, Enum):
     LONG = "long"
     SHORT = "short"
 
-@dataclass
+class FillDirection(Enum):
+    """Normalized fill direction, derived once from the wire string
+
+    Hyperliquid sends textual directions ("Open Long", "Close Short");
+    converting to an enum up front replaces repeated substring scans in
+    the fill handlers with single compares and table lookups.
+    """
+    OPEN_LONG = 0
+    OPEN_SHORT = 1
+    CLOSE_LONG = 2
+    CLOSE_SHORT = 3
+
+    @classmethod
+    def from_wire(cls, direction: str, side: str = "") -> "FillDirection":
+        """Map a textual direction (falling back to the B/A side flag)"""
+        closing = "Close" in direction
+        if "Long" in direction:
+            is_long = True
+        elif "Short" in direction:
+            is_long = False
+        else:
+            is_long = side == "B"
+
+        if is_long:
+            return cls.CLOSE_LONG if closing else cls.OPEN_LONG
+        return cls.CLOSE_SHORT if closing else cls.OPEN_SHORT
+
+    @property
+    def is_closing(self) -> bool:
+        return self is FillDirection.CLOSE_LONG or self is FillDirection.CLOSE_SHORT
+
+@dataclass(slots=True, frozen=True)
 class Position:
     """Represents an open position"""
     symbol: str
@@ -47,7 +78,7 @@ class Position:
         else:  # SHORT
             return ((self.entry_price - self.current_price) / self.entry_price) * 100
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Order:
     """Represents an order (open or filled)"""
     order_id: str
@@ -69,7 +100,7 @@ class Order:
     def is_open(self) -> bool:
         return self.status == "open"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Trade:
     """Represents a completed trade"""
     trade_id: str
@@ -81,7 +112,7 @@ class Trade:
     fee: Optional[float] = None
     order_id: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UserState:
     """Represents the complete state of a user's account"""
     address: str
@@ -109,7 +140,7 @@ class UserState:
             return 0.0
         return (self.margin_used / self.balance) * 100
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WebSocketUpdate:
     """Represents a WebSocket update event"""
     channel: str
@@ -23,7 +23,14 @@ class HyperliquidWebSocket:
         """Establish WebSocket connection"""
         try:
             logger.info(f"Connecting to Hyperliquid WebSocket: {self.ws_url}")
-            self.ws = await websockets.connect(self.ws_url)
+            # Protocol-level ping/pong keepalive so dead sockets are
+            # detected within ~ping_interval+ping_timeout instead of on
+            # the next failed send; the listen() loop then reconnects
+            self.ws = await websockets.connect(
+                self.ws_url,
+                ping_interval=20,
+                ping_timeout=30
+            )
             self.is_running = True
             logger.info("WebSocket connected successfully")
             
@@ -182,10 +189,8 @@ class HyperliquidWebSocket:
                             await callback(update)
                         else:
                             callback(update)
-                    except Exception as e:
-                        logger.error(f"Error in callback for {callback_channel}: {e}")
-                        import traceback
-                        logger.error(traceback.format_exc())
+                    except Exception:
+                        logger.exception(f"Error in callback for {callback_channel}")
             
             if not callback_found:
                 logger.warning(f"⚠️ No callback found for channel: {channel}")
@@ -193,10 +198,8 @@ class HyperliquidWebSocket:
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse WebSocket message: {e}")
             logger.error(f"Raw message: {message}")
-        except Exception as e:
-            logger.error(f"Error handling WebSocket message: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+        except Exception:
+            logger.exception("Error handling WebSocket message")
     
     async def listen(self):
         """
@@ -1,18 +1,29 @@
 import asyncio
+import sys
+import time
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime
-from decimal import Decimal
 from loguru import logger
 from config.settings import settings
 from utils.logger import setup_logger
 from hyperliquid.client import HyperliquidClient
 from hyperliquid.websocket import HyperliquidWebSocket
-from hyperliquid.models import WebSocketUpdate, PositionSide, OrderSide
+from hyperliquid.models import WebSocketUpdate, PositionSide, OrderSide, FillDirection
 from copy_engine import WalletMonitor, TradeExecutor, PositionSizer
 from telegram_bot import TelegramBot, NotificationService
 
 # Setup logging
 setup_logger(settings.log_file, settings.log_level)
 
+# Hot-path settings snapshot - the config is frozen after load, so the
+# fill handlers read module globals instead of walking the attribute
+# chain per event
+SIMULATED_TRADING = settings.simulated_trading
+USE_LIMIT_ORDERS = settings.copy_rules.use_limit_orders
+AUTO_ADJUST_SIZE = settings.copy_rules.auto_adjust_size
+SIZING_MODE = settings.sizing.mode
+
 # Initialize components
 monitor: WalletMonitor = None
 executor: TradeExecutor = None
@@ -21,59 +32,291 @@ client: HyperliquidClient = None
 telegram_bot: TelegramBot = None
 notifier: NotificationService = None
 
-# State tracking
-is_paused = False
-trades_copied_count = 0
-bot_start_time = None
 
-# Simulated account tracking
-simulated_balance = 0.0
-simulated_positions = {}  # symbol -> {'size': float, 'entry_price': float, 'side': str}
-simulated_pnl = 0.0
+@dataclass(slots=True)
+class AppState:
+    """Mutable runtime state shared by the event handlers
+    
+    One slotted object instead of a pile of module globals: handlers read
+    slots off a single reference and no longer need global declarations.
+    """
+    is_paused: bool = False
+    trades_copied_count: int = 0
+    bot_start_time: datetime = None
+    
+    # Simulated account tracking
+    simulated_balance: float = 0.0
+    simulated_positions: dict = None  # symbol -> SimulatedPosition
+    simulated_pnl: float = 0.0
+    
+    # Your actual wallet balance (for proportional sizing in live mode)
+    your_actual_balance: float = 0.0
+    
+    # YOUR positions snapshot + freshness timestamp
+    your_positions_cache: dict = None
+    your_positions_cache_ts: float = 0.0
+    
+    def __post_init__(self):
+        self.simulated_positions = {}
+        self.your_positions_cache = {}
+
+
+state = AppState()
+
+@dataclass(slots=True)
+class SimulatedPosition:
+    """A position held by the simulated account
+
+    Slotted so the per-fill accounting reads attributes instead of
+    hashing dict keys.
+    """
+    size: float = 0.0            # signed: negative = short
+    entry_price: float = 0.0
+    side: str = ''
+    leverage: float = 1.0
+    value: float = 0.0
+    margin_used: float = 0.0
+
+
+def simulated_unrealized_pnl() -> float:
+    """Mark the simulated book to market in a single sweep
+    
+    Signed sizes make longs and shorts the same expression; prices come
+    from the monitor's per-symbol snapshot. Kept as one pass over the
+    dataclass slots - portfolios here are far too small for numpy to pay
+    for its own import.
+    """
+    if not monitor or not state.simulated_positions:
+        return 0.0
+    
+    total = 0.0
+    positions_by_symbol = monitor.last_positions_by_symbol
+    for symbol, pos in state.simulated_positions.items():
+        target_pos = positions_by_symbol.get(symbol)
+        if target_pos and target_pos.current_price > 0:
+            total += pos.size * (target_pos.current_price - pos.entry_price)
+    return total
+
+
+# (position side, order side, is_closing) per normalized fill direction
+_FILL_LUT = {
+    FillDirection.OPEN_LONG: (PositionSide.LONG, OrderSide.BUY, False),
+    FillDirection.OPEN_SHORT: (PositionSide.SHORT, OrderSide.SELL, False),
+    FillDirection.CLOSE_LONG: (PositionSide.LONG, OrderSide.SELL, True),
+    FillDirection.CLOSE_SHORT: (PositionSide.SHORT, OrderSide.BUY, True),
+}
+
+
+@dataclass(slots=True)
+class SizingView:
+    """Precomputed copy sizing for one target symbol"""
+    target_value: float
+    your_size: float
+    your_leverage: int
+    margin_needed: float
+
+
+# Per-symbol sizing cache rebuilt once per target-state refresh, so
+# bursty fills on the same symbol reuse one multiply chain
+sizing_cache = {}
+
+
+def rebuild_sizing_cache(positions):
+    """Recompute the per-symbol sizing views from a fresh state"""
+    global sizing_cache
+    ratio = settings.sizing.portfolio_ratio
+    cache = {}
+    for pos in positions:
+        if pos.entry_price <= 0:
+            continue
+        target_value = abs(pos.size) * pos.entry_price
+        your_value = target_value * ratio
+        your_leverage = calculate_matching_leverage(pos.leverage, pos.symbol)
+        cache[pos.symbol] = SizingView(
+            target_value=target_value,
+            your_size=your_value / pos.entry_price,
+            your_leverage=your_leverage,
+            margin_needed=your_value / your_leverage
+        )
+    sizing_cache = cache
+
+
+# TP/SL classification by (trigger condition, order side). A 'gt'
+# trigger closing via SELL takes profit on a long; 'gt' closing via BUY
+# stops out a short; 'lt' is the mirror image.
+_TP_SL_TABLE = {
+    ('gt', OrderSide.SELL): (True, False),   # take-profit
+    ('gt', OrderSide.BUY): (False, True),    # stop-loss
+    ('lt', OrderSide.SELL): (False, True),   # stop-loss
+    ('lt', OrderSide.BUY): (True, False),    # take-profit
+}
+
+
+@dataclass(slots=True)
+class SizingContext:
+    """Balance snapshot shared across fills until either balance changes"""
+    our_balance: float
+    target_balance: float
+    ratio: float
+
+
+# Cached sizing context - the balances (and thus the expected ratio)
+# change far less often than fills arrive
+sizing_ctx: SizingContext = None
+
+# Background task keepalive - fire-and-forget notifications must stay
+# referenced until done or the event loop may destroy them mid-flight
+_bg_tasks = set()
+
+
+def _log_bg_result(task: asyncio.Task):
+    _bg_tasks.discard(task)
+    if not task.cancelled() and task.exception():
+        logger.error(f"Background task {task.get_name()} failed: {task.exception()}")
+
+
+def fire_and_forget(coro, name: str = None) -> asyncio.Task:
+    """Run a coroutine in the background without blocking the handler
+    
+    Failures are logged from the done callback; pending tasks are drained
+    at shutdown so nothing is destroyed mid-flight.
+    """
+    task = asyncio.create_task(coro, name=name)
+    _bg_tasks.add(task)
+    task.add_done_callback(_log_bg_result)
+    return task
+
+
+# Hot-path size function, bound once after startup fixes the sizing mode
+# and ratio - avoids re-branching on settings per copied trade
+_compute_your_size = None
+
+
+def bind_sizing_fast_path():
+    """Bind the per-trade size calculation to the configured mode"""
+    global _compute_your_size
+    if settings.sizing.mode == "proportional":
+        ratio = settings.sizing.portfolio_ratio
+        _compute_your_size = lambda size, price, _ratio=ratio: abs(size) * _ratio
+    else:
+        fixed = settings.sizing.fixed_size
+        _compute_your_size = lambda size, price, _fixed=fixed: _fixed / price if price > 0 else 0
+
+
+def get_sizing_context() -> SizingContext:
+    """Get the cached sizing context, recomputing only on balance change"""
+    global sizing_ctx
+    
+    target_balance = monitor.current_state.balance if monitor and monitor.current_state else 1000000
+    our_balance = state.your_actual_balance if state.your_actual_balance > 0 else state.simulated_balance
+    
+    if (sizing_ctx is None
+            or sizing_ctx.target_balance != target_balance
+            or sizing_ctx.our_balance != our_balance):
+        ratio = our_balance / target_balance if target_balance > 0 else 0.0
+        sizing_ctx = SizingContext(our_balance, target_balance, ratio)
+    
+    return sizing_ctx
+
+
+# The your-positions snapshot (state.your_positions_cache) is kept warm
+# by applying our own executed fills locally; REST is only hit when it
+# goes stale. This keeps the per-fill hot path free of an HTTP round-trip
+YOUR_POSITIONS_TTL = 10.0  # seconds before the snapshot is considered stale
+
 
-# Your actual wallet balance (for proportional sizing in live mode)
-your_actual_balance = 0.0
+async def get_your_positions(force: bool = False) -> dict:
+    """Get your positions, served from the local cache unless stale
+    
+    Args:
+        force: Refresh from REST regardless of cache age
+    
+    Returns:
+        Dict mapping symbol to position info
+    """
+    
+    if force or time.monotonic() - state.your_positions_cache_ts > YOUR_POSITIONS_TTL:
+        state.your_positions_cache = await executor.get_my_positions()
+        state.your_positions_cache_ts = time.monotonic()
+    
+    return state.your_positions_cache
+
+
+def apply_fill_to_your_cache(symbol: str, side: str, size: float, price: float, is_closing: bool):
+    """Apply one of our own executed fills to the local positions cache
+    
+    Keeps the cache authoritative between REST reconciliations so
+    consecutive fills don't need to re-fetch.
+    """
+    pos = state.your_positions_cache.get(symbol)
+    
+    if is_closing:
+        if pos:
+            pos["size"] = max(0.0, pos["size"] - size)
+            if pos["size"] <= 0:
+                del state.your_positions_cache[symbol]
+    elif pos:
+        # Adding to an existing position - update size and entry VWAP
+        total_value = pos["size"] * pos["entry_price"] + size * price
+        pos["size"] += size
+        pos["entry_price"] = total_value / pos["size"] if pos["size"] > 0 else price
+    else:
+        state.your_positions_cache[symbol] = {
+            "size": size,
+            "side": side,
+            "signed_size": size if side == "LONG" else -size,
+            "entry_price": price,
+            "leverage": 1.0
+        }
 
-# YOUR positions cache - updated periodically and on fills
-your_positions_cache = {}  # symbol -> {'size': float, 'side': str, 'entry_price': float}
+
+# Maximum allowed leverage per asset on Hyperliquid - module-level
+# constant so leverage lookups don't rebuild the dict per call
+_MAX_LEVERAGE_LIMITS = {
+    'BTC': 50,
+    'ETH': 50,
+    'SOL': 20,
+    'MATIC': 20,
+    'ARB': 20,
+    'OP': 20,
+    'AVAX': 20,
+    'DOGE': 20,
+    'ATOM': 10,
+    'LTC': 10,
+    'BCH': 10,
+    'LINK': 10,
+    'UNI': 10,
+    'APE': 10,
+    'APT': 10,
+    'SUI': 10,
+    'TIA': 10,
+    'SEI': 10,
+    'WLD': 10,
+    'NEAR': 10,
+    'FET': 10,
+    'INJ': 10,
+    'STX': 10,
+    'PEPE': 10,
+    'BONK': 10,
+    'WIF': 10,
+    'HYPE': 10,
+    'ZEC': 10,
+    'TRUMP': 10,
+    'MELANIA': 10,
+    'PUMP': 10,
+}
 
 
 def get_max_leverage_for_asset(symbol: str) -> int:
     """Get the maximum allowed leverage for an asset on Hyperliquid"""
-    MAX_LEVERAGE_LIMITS = {
-        'BTC': 50,
-        'ETH': 50,
-        'SOL': 20,
-        'MATIC': 20,
-        'ARB': 20,
-        'OP': 20,
-        'AVAX': 20,
-        'DOGE': 20,
-        'ATOM': 10,
-        'LTC': 10,
-        'BCH': 10,
-        'LINK': 10,
-        'UNI': 10,
-        'APE': 10,
-        'APT': 10,
-        'SUI': 10,
-        'TIA': 10,
-        'SEI': 10,
-        'WLD': 10,
-        'NEAR': 10,
-        'FET': 10,
-        'INJ': 10,
-        'STX': 10,
-        'PEPE': 10,
-        'BONK': 10,
-        'WIF': 10,
-        'HYPE': 10,
-        'ZEC': 10,
-        'TRUMP': 10,
-        'MELANIA': 10,
-        'PUMP': 10,
-    }
-    return MAX_LEVERAGE_LIMITS.get(symbol.upper(), 10)
+    return _MAX_LEVERAGE_LIMITS.get(symbol.upper(), 10)
+
+
+@lru_cache(maxsize=1024)
+def _match_leverage(rounded_leverage: int, symbol_upper: str) -> int:
+    """Clamp a rounded leverage to [1, asset max] - memoized since the
+    same (leverage, symbol) pairs repeat across a wallet's fills"""
+    return min(max(1, rounded_leverage), _MAX_LEVERAGE_LIMITS.get(symbol_upper, 10))
 
 
 def calculate_matching_leverage(target_leverage: float, symbol: str) -> int:
@@ -90,29 +333,17 @@ def calculate_matching_leverage(target_leverage: float, symbol: str) -> int:
     Returns:
         Integer leverage matching target's (capped at asset max)
     """
-    max_leverage = get_max_leverage_for_asset(symbol)
-    
-    # Round to nearest integer
-    rounded_leverage = round(target_leverage)
-    
-    # Ensure minimum of 1x
-    rounded_leverage = max(1, rounded_leverage)
-    
-    # Cap at asset's max leverage
-    final_leverage = min(rounded_leverage, max_leverage)
-    
-    return final_leverage
+    return _match_leverage(round(target_leverage), symbol.upper())
 
 
-async def on_new_position(position_data: dict):
+async def on_new_position(position_data: dict, _LONG=PositionSide.LONG, _SHORT=PositionSide.SHORT):
     """
     Called when target wallet opens a new position
     This is where we copy the trade!
     """
-    global trades_copied_count, is_paused, simulated_balance, simulated_positions, simulated_pnl
     
     # Check if paused
-    if is_paused:
+    if state.is_paused:
         logger.warning("⏸️ Bot is paused - skipping trade")
         return
     
@@ -128,25 +359,29 @@ async def on_new_position(position_data: dict):
         current_equity = monitor.current_state.total_equity if monitor.current_state else 0
         if current_equity >= settings.copy_rules.max_account_equity:
             logger.warning(f"⚠️ Max account equity reached (${current_equity:,.2f}/${settings.copy_rules.max_account_equity:,.2f}) - stopping copy trading")
-            is_paused = True
+            state.is_paused = True
             if notifier:
                 await notifier.send_error_notification(f"Max account equity reached: ${current_equity:,.2f}. Bot paused automatically.")
             return
     
     try:
-        logger.success("=" * 60)
+        logger.success(_BANNER_60)
         logger.success("🎯 NEW POSITION DETECTED - COPYING TRADE!")
-        logger.success("=" * 60)
+        logger.success(_BANNER_60)
         
         # Parse position data
-        symbol = position_data.get("coin", "")
+        symbol = _sym(position_data.get("coin", ""))
         size = float(position_data.get("szi", 0))
-        side = PositionSide.LONG if size > 0 else PositionSide.SHORT
+        side = _LONG if size > 0 else _SHORT
         
         position_info = position_data.get("position", {})
         entry_price = float(position_info.get("entryPx", 0))
         target_leverage = float(position_info.get("leverage", {}).get("value", 1))
         
+        # Kick off the market-price fetch immediately so it overlaps the
+        # local parsing/logging below instead of serializing after it
+        price_task = asyncio.create_task(client.get_market_price(symbol))
+        
         logger.info(f"📊 Target Position:")
         logger.info(f"   Symbol: {symbol}")
         logger.info(f"   Side: {side.value.upper()}")
@@ -154,11 +389,9 @@ async def on_new_position(position_data: dict):
         logger.info(f"   Entry: ${entry_price:,.2f}")
         logger.info(f"   Leverage: {target_leverage}x")
         
-        # Get current market price
-        async with client:
-            current_price = await client.get_market_price(symbol)
-            if not current_price:
-                current_price = entry_price
+        current_price = await price_task
+        if not current_price:
+            current_price = entry_price
         
         logger.info(f"   Current Price: ${current_price:,.2f}")
         
@@ -181,11 +414,10 @@ async def on_new_position(position_data: dict):
         your_balance = 1000  # TODO: Get actual balance from your account
         your_exposure = 0  # TODO: Calculate current exposure
         
-        # Simplified calculation for now
-        if settings.sizing.mode == "proportional":
-            your_size = abs(size) * settings.sizing.portfolio_ratio
-        else:
-            your_size = settings.sizing.fixed_size / entry_price if entry_price > 0 else 0
+        # Single pre-bound call instead of re-branching on settings
+        if _compute_your_size is None:
+            bind_sizing_fast_path()
+        your_size = _compute_your_size(size, entry_price)
         
         # Use SAME leverage as target for true proportional copying
         your_leverage = calculate_matching_leverage(
@@ -211,11 +443,12 @@ async def on_new_position(position_data: dict):
         if result:
             logger.success(f"✅ Trade executed successfully!")
             logger.success(f"   Result: {result}")
-            trades_copied_count += 1
+            state.trades_copied_count += 1
             
             # Send Telegram notification
             if notifier:
-                await notifier.send_trade_notification(
+                # Don't hold the copy handler hostage to Telegram latency
+                fire_and_forget(notifier.send_trade_notification(
                     symbol=symbol,
                     side=side.value,
                     size=your_size,
@@ -223,13 +456,13 @@ async def on_new_position(position_data: dict):
                     leverage=your_leverage,
                     target_size=abs(size),
                     is_simulated=executor.dry_run
-                )
+                ), name=f"tg-{symbol}")
         else:
             logger.error("❌ Trade execution failed")
             if notifier:
                 await notifier.send_error_notification(f"Failed to execute trade for {symbol}")
         
-        logger.success("=" * 60)
+        logger.success(_BANNER_60)
         
     except Exception as e:
         logger.error(f"Error copying position: {e}")
@@ -239,58 +472,124 @@ async def on_new_position(position_data: dict):
 
 async def on_position_close(position_data: dict):
     """Called when target wallet closes a position"""
-    global simulated_balance, simulated_positions, simulated_pnl
     
-    symbol = position_data.get("coin", "")
+    symbol = _sym(position_data.get("coin", ""))
     logger.info(f"🔴 Target closed position: {symbol}")
     
+    # The monitor evicts the symbol from its index before this callback
+    # runs, so exit pricing comes from the pre-merge snapshot it
+    # attaches to the payload
+    closed_pos = position_data.get("closedPosition")
+    
+    # Snapshot our own position before the accounting below deletes it -
+    # the close order needs its size and side
+    sim_pos = state.simulated_positions.get(symbol)
+    
     # Close simulated position and calculate PnL
-    if settings.simulated_trading and symbol in simulated_positions:
-        pos = simulated_positions[symbol]
-        # Get current price from monitor
-        current_price = 0
-        if monitor.current_state:
-            for p in monitor.current_state.positions:
-                if p.symbol == symbol:
-                    current_price = p.current_price
-                    break
+    if settings.simulated_trading and sim_pos is not None:
+        pos = sim_pos
+        current_price = closed_pos.current_price if closed_pos else 0
         
         if current_price > 0:
             # Calculate PnL
-            if pos['side'] == 'LONG':
-                pnl = pos['size'] * (current_price - pos['entry_price'])
+            if pos.side == 'LONG':
+                pnl = pos.size * (current_price - pos.entry_price)
             else:
-                pnl = abs(pos['size']) * (pos['entry_price'] - current_price)
+                pnl = abs(pos.size) * (pos.entry_price - current_price)
             
             # Return margin to balance
-            margin_used = pos['value'] / pos['leverage']
-            simulated_balance += margin_used + pnl
-            simulated_pnl += pnl
+            margin_used = pos.value / pos.leverage
+            state.simulated_balance += margin_used + pnl
+            state.simulated_pnl += pnl
             
             logger.success(f"\n💰 SIMULATED POSITION CLOSED!")
-            logger.success(f"   Entry: ${pos['entry_price']:,.2f}")
+            logger.success(f"   Entry: ${pos.entry_price:,.2f}")
             logger.success(f"   Exit: ${current_price:,.2f}")
-            logger.success(f"   PnL: ${pnl:,.2f} ({(pnl/pos['value']*100):+.2f}%)")
-            logger.success(f"   New Balance: ${simulated_balance:,.2f}")
-            logger.success(f"   Total PnL: ${simulated_pnl:,.2f}")
+            logger.success(f"   PnL: ${pnl:,.2f} ({(pnl/pos.value*100):+.2f}%)")
+            logger.success(f"   New Balance: ${state.simulated_balance:,.2f}")
+            logger.success(f"   Total PnL: ${state.simulated_pnl:,.2f}")
             
-            del simulated_positions[symbol]
+            del state.simulated_positions[symbol]
+    
+    # Close your corresponding position, sized from our own book (live
+    # cache or simulated snapshot), falling back to the target snapshot
+    your_pos = state.your_positions_cache.get(symbol)
+    if your_pos:
+        close_size = your_pos["size"]
+        held_side = your_pos["side"]
+    elif sim_pos is not None:
+        close_size = abs(sim_pos.size)
+        held_side = sim_pos.side
+    elif closed_pos is not None:
+        close_size = abs(closed_pos.size)
+        held_side = closed_pos.side.value.upper()
+    else:
+        close_size = 0
+        held_side = 'LONG'
     
-    # Close your corresponding position
-    logger.info("   -> Closing your position...")
-    await executor.close_position(symbol)
+    if close_size > 0:
+        logger.info("   -> Closing your position...")
+        close_side = OrderSide.SELL if held_side == 'LONG' else OrderSide.BUY
+        await executor.close_position(symbol, close_size, close_side)
+    else:
+        logger.info("   -> No position of ours to close")
+
+
+# Log banner constants, folded once at import instead of per event
+_BANNER_50 = "=" * 50
+_BANNER_60 = "=" * 60
+
+# Hyperliquid rejects orders below this notional value
+MIN_ORDER_VALUE = 10.0
+
+
+def _sym(symbol: str) -> str:
+    """Normalize + intern a symbol so downstream dict probes compare by
+    pointer instead of re-hashing the same few strings per fill"""
+    return sys.intern(symbol.upper()) if symbol else ''
+
+# Per-symbol debounce state for position updates - rapid adjustments
+# within the window coalesce into one handler run with the latest size
+pending_position_updates = {}  # symbol -> asyncio.Task
+latest_position_updates = {}   # symbol -> most recent position_data
+POSITION_UPDATE_DEBOUNCE = 0.25  # seconds
+
+
+async def _flush_position_update(symbol: str):
+    """Process the newest coalesced update for a symbol after the window"""
+    try:
+        await asyncio.sleep(POSITION_UPDATE_DEBOUNCE)
+        position_data = latest_position_updates.pop(symbol, None)
+        pending_position_updates.pop(symbol, None)
+        if position_data is None:
+            return
+        
+        size = float(position_data.get("szi", 0))
+        logger.info(f"📊 Target updated position: {symbol} (new size: {size})")
+        
+        # TODO: Submit one net-delta order against your cached position
+    except asyncio.CancelledError:
+        pass
 
 
 async def on_position_update(position_data: dict):
-    """Called when target wallet updates a position"""
-    symbol = position_data.get("coin", "")
-    size = float(position_data.get("szi", 0))
-    logger.info(f"📊 Target updated position: {symbol} (new size: {size})")
+    """Called when target wallet updates a position
+    
+    Bursts of updates for the same symbol are debounced so they fan out
+    to a single consolidated handling instead of N reactions.
+    """
+    symbol = _sym(position_data.get("coin", ""))
+    latest_position_updates[symbol] = position_data
     
-    # TODO: Update your position to match
+    existing = pending_position_updates.get(symbol)
+    if existing and not existing.done():
+        existing.cancel()
+    
+    pending_position_updates[symbol] = asyncio.create_task(_flush_position_update(symbol))
 
 
-async def on_new_order(order_data: dict):
+async def on_new_order(order_data: dict, _BUY=OrderSide.BUY, _SELL=OrderSide.SELL,
+                       _LONG=PositionSide.LONG, _SHORT=PositionSide.SHORT):
     """
     Called when target wallet places a new order.
     Handles:
@@ -298,11 +597,9 @@ async def on_new_order(order_data: dict):
     - Stop-loss (SL) trigger orders
     - Take-profit (TP) trigger orders
     """
-    global trades_copied_count, is_paused, simulated_balance, simulated_positions
-    global your_positions_cache
     
     # Check if paused
-    if is_paused:
+    if state.is_paused:
         logger.warning("⏸️ Bot is paused - skipping order copy")
         return
     
@@ -318,19 +615,22 @@ async def on_new_order(order_data: dict):
             return
     
     try:
-        symbol = order_data.get('coin', '')
+        symbol = _sym(order_data.get('coin', ''))
         side_str = order_data.get('side', '')  # 'B' for buy, 'A' for sell
         order_type = order_data.get('orderType', 'Limit')
         target_size = abs(float(order_data.get('sz', 0)))
-        limit_price = float(order_data.get('limitPx', 0)) if order_data.get('limitPx') else 0
-        trigger_price = float(order_data.get('triggerPx', 0)) if order_data.get('triggerPx') else None
+        # Read each field once, convert once
+        limit_px_raw = order_data.get('limitPx')
+        limit_price = float(limit_px_raw) if limit_px_raw else 0
+        trigger_px_raw = order_data.get('triggerPx')
+        trigger_price = float(trigger_px_raw) if trigger_px_raw else None
         is_trigger = order_data.get('isTrigger', False)
         is_position_tpsl = order_data.get('isPositionTpsl', False)
-        trigger_condition = order_data.get('triggerCondition', '')  # "gt" or "lt"
+        trigger_condition = sys.intern(order_data.get('triggerCondition', ''))  # "gt" or "lt"
         reduce_only = order_data.get('reduceOnly', False)
         
         # Convert side
-        order_side = OrderSide.BUY if side_str == 'B' else OrderSide.SELL
+        order_side = _BUY if side_str == 'B' else _SELL
         
         # Determine if this is a TP or SL based on trigger condition
         # For longs: SL triggers when price < trigger (lt), TP triggers when price > trigger (gt)
@@ -339,20 +639,10 @@ async def on_new_order(order_data: dict):
         is_stop_loss = False
         
         if is_trigger or trigger_price:
-            # Determine TP vs SL
-            # If we have a position, check which direction this protects
-            if trigger_condition == 'gt':
-                # Triggers when price goes above trigger_price
-                # For a SHORT position closing (BUY), this would be a SL
-                # For a LONG position closing (SELL), this would be a TP
-                is_take_profit = (order_side == OrderSide.SELL)
-                is_stop_loss = (order_side == OrderSide.BUY)
-            elif trigger_condition == 'lt':
-                # Triggers when price goes below trigger_price
-                # For a LONG position closing (SELL), this would be a SL
-                # For a SHORT position closing (BUY), this would be a TP
-                is_stop_loss = (order_side == OrderSide.SELL)
-                is_take_profit = (order_side == OrderSide.BUY)
+            # Single table probe instead of the nested condition/side chain
+            is_take_profit, is_stop_loss = _TP_SL_TABLE.get(
+                (trigger_condition, order_side), (False, False)
+            )
         
         order_type_display = "LIMIT"
         if is_stop_loss:
@@ -362,9 +652,9 @@ async def on_new_order(order_data: dict):
         elif is_trigger:
             order_type_display = "TRIGGER"
         
-        logger.info(f"\n{'='*50}")
+        logger.info("\n" + _BANNER_50)
         logger.info(f"📋 NEW ORDER DETECTED - {order_type_display}!")
-        logger.info(f"{'='*50}")
+        logger.info(_BANNER_50)
         logger.info(f"Symbol: {symbol}")
         logger.info(f"Side: {order_side.value}")
         logger.info(f"Type: {order_type_display}")
@@ -383,67 +673,67 @@ async def on_new_order(order_data: dict):
             # For TP/SL, size should be based on YOUR position, not proportional
             your_position_size = 0.0
             
-            if not settings.simulated_trading:
+            if not SIMULATED_TRADING:
                 try:
-                    your_positions_cache = await executor.get_my_positions()
-                    if symbol in your_positions_cache:
-                        your_position_size = your_positions_cache[symbol]["size"]
+                    positions = await get_your_positions()
+                    if symbol in positions:
+                        your_position_size = positions[symbol]["size"]
                         logger.info(f"📊 Your {symbol} position: {your_position_size:.6f}")
                 except Exception as e:
                     logger.warning(f"Could not fetch your positions: {e}")
             else:
-                if symbol in simulated_positions:
-                    your_position_size = abs(simulated_positions[symbol].get('size', 0))
+                if symbol in state.simulated_positions:
+                    your_position_size = abs(state.simulated_positions[symbol].size)
             
             if your_position_size <= 0:
                 logger.warning(f"⚠️ Skipping {order_type_display} - no position to protect!")
                 return
             
             # Calculate close ratio from target's position
-            target_position_size = 0.0
-            if monitor.current_state:
-                for pos in monitor.current_state.positions:
-                    if pos.symbol == symbol:
-                        target_position_size = abs(pos.size)
-                        break
+            target_pos = monitor.last_positions_by_symbol.get(symbol)
+            target_position_size = abs(target_pos.size) if target_pos else 0.0
             
             if target_position_size > 0:
                 close_ratio = target_size / target_position_size
                 our_size = your_position_size * close_ratio
-                logger.info(f"📊 {order_type_display} Sizing:")
-                logger.info(f"   Target position: {target_position_size:.6f}")
-                logger.info(f"   Target {order_type_display}: {target_size:.6f} ({close_ratio*100:.1f}%)")
-                logger.info(f"   Your position: {your_position_size:.6f}")
-                logger.info(f"   → Your {order_type_display}: {our_size:.6f} ({close_ratio*100:.1f}%)")
+                logger.opt(lazy=True).debug(
+                    "{ot} sizing: target {tp:.6f}, closing {ts:.6f} ({cr:.1f}%), yours {yp:.6f} -> {os:.6f}",
+                    ot=lambda: order_type_display,
+                    tp=lambda: target_position_size,
+                    ts=lambda: target_size,
+                    cr=lambda: close_ratio * 100,
+                    yp=lambda: your_position_size,
+                    os=lambda: our_size
+                )
             else:
                 # Full position TP/SL
                 our_size = your_position_size
                 logger.info(f"📊 Full position {order_type_display}: {our_size:.6f}")
         else:
             # For regular limit orders, use proportional sizing
-            if settings.copy_rules.auto_adjust_size:
+            if AUTO_ADJUST_SIZE:
                 # Create a placeholder position for sizing
                 from hyperliquid.models import Position
                 target_position = Position(
                     symbol=symbol,
                     size=target_size,
-                    side=PositionSide.LONG if order_side == OrderSide.BUY else PositionSide.SHORT,
+                    side=_LONG if order_side == _BUY else _SHORT,
                     entry_price=limit_price,
                     current_price=limit_price,
                     leverage=1.0,
                     unrealized_pnl=0.0,
                     liquidation_price=0.0
                 )
+                ctx = get_sizing_context()
                 our_size = position_sizer.calculate_size(
                     target_position=target_position,
-                    target_wallet_balance=monitor.current_state.balance if monitor.current_state else 1000000,
-                    your_wallet_balance=your_actual_balance if your_actual_balance > 0 else simulated_balance
+                    target_wallet_balance=ctx.target_balance,
+                    your_wallet_balance=ctx.our_balance
                 )
             else:
                 our_size = target_size
             
-            logger.info(f"\n📊 Order Sizing:")
-            logger.info(f"   Our Size: {our_size:.6f}")
+            logger.opt(lazy=True).debug("Order sizing: our size {os:.6f}", os=lambda: our_size)
         
         if not our_size or our_size <= 0:
             logger.warning(f"⚠️ Skipping order - size is zero")
@@ -464,17 +754,17 @@ async def on_new_order(order_data: dict):
             
             if result:
                 logger.success(f"✅ {order_type_display} order copied successfully!")
-                trades_copied_count += 1
+                state.trades_copied_count += 1
                 
                 if notifier:
-                    await notifier.send_trade_notification(
+                    fire_and_forget(notifier.send_trade_notification(
                         symbol=symbol,
                         side=order_side.value,
                         size=our_size,
                         price=trigger_price,
                         leverage=1.0,
                         target_size=target_size
-                    )
+                    ), name=f"tg-{symbol}")
             else:
                 logger.error(f"❌ Failed to copy {order_type_display} order")
         else:
@@ -482,45 +772,79 @@ async def on_new_order(order_data: dict):
             result = await executor.execute_limit_order(
                 symbol=symbol,
                 side=order_side,
-                size=Decimal(str(our_size)),
-                price=Decimal(str(limit_price)),
+                size=our_size,
+                price=limit_price,
                 reduce_only=reduce_only
             )
             
             if result:
                 logger.success(f"✅ Limit order copied successfully!")
-                trades_copied_count += 1
+                state.trades_copied_count += 1
                 
                 # Log simulated order
-                if settings.simulated_trading:
+                if SIMULATED_TRADING:
                     order_value = our_size * limit_price
                     logger.success(f"\n📋 SIMULATED ORDER PLACED!")
                     logger.success(f"   Order Value: ${order_value:,.2f}")
-                    logger.success(f"   Account Balance: ${simulated_balance:,.2f}")
+                    logger.success(f"   Account Balance: ${state.simulated_balance:,.2f}")
                 
                 # Send notification
                 if notifier:
-                    await notifier.send_trade_notification(
+                    fire_and_forget(notifier.send_trade_notification(
                         symbol=symbol,
                         side=order_side.value,
                         size=our_size,
                         price=limit_price,
                         leverage=1.0,
                         target_size=target_size
-                    )
+                    ), name=f"tg-{symbol}")
             else:
                 logger.error(f"❌ Failed to copy limit order")
             
-    except Exception as e:
-        logger.error(f"Error copying order: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+    except Exception:
+        logger.exception("Error copying order")
+
+
+# Fill-copy worker pool - the WS callback only enqueues, so ingestion
+# never serializes behind exchange round-trips during fill bursts.
+# Fills are sharded to a worker by symbol: same-symbol fills stay
+# strictly ordered (a close enqueued before an open must execute first)
+# while different symbols still overlap
+fill_queues: list = None
+FILL_WORKER_COUNT = 4
+sim_lock = asyncio.Lock()  # guards simulated accounting across workers
+
+
+async def _fill_worker(queue: asyncio.Queue):
+    """Consume one shard's fills and run the copy pipeline in order"""
+    while True:
+        fill_data = await queue.get()
+        try:
+            await _copy_fill(fill_data)
+        except Exception:
+            logger.exception("Error copying fill")
+        finally:
+            queue.task_done()
 
 
 async def on_order_fill(fill_data: dict):
+    """Called when an order is filled - enqueues on the symbol's shard
+    
+    Returns in microseconds so the monitor can keep draining the
+    WebSocket; the pool overlaps submissions across symbols.
     """
-    Called when an order is filled
-    Copy the filled order
+    if fill_queues is not None:
+        symbol = _sym(fill_data.get('coin', ''))
+        fill_queues[hash(symbol) % FILL_WORKER_COUNT].put_nowait(fill_data)
+    else:
+        # Workers not started (e.g. tests driving the handler directly)
+        await _copy_fill(fill_data)
+
+
+async def _copy_fill(fill_data: dict, _BUY=OrderSide.BUY, _SELL=OrderSide.SELL,
+                     _LONG=PositionSide.LONG, _SHORT=PositionSide.SHORT):
+    """
+    Copy a filled order from the target wallet
     
     CRITICAL: For CLOSE orders, we must check YOUR actual position size,
     not just scale the target's close size proportionally. Otherwise we
@@ -530,11 +854,9 @@ async def on_order_fill(fill_data: dict):
     are aggregated by order ID in monitor.py before this function is called,
     so this function receives the complete order with total size.
     """
-    global trades_copied_count, is_paused, simulated_balance, simulated_positions, simulated_pnl
-    global your_positions_cache
     
     # Check if paused
-    if is_paused:
+    if state.is_paused:
         logger.warning("⏸️ Bot is paused - skipping fill copy")
         return
     
@@ -542,7 +864,7 @@ async def on_order_fill(fill_data: dict):
         # Extract order ID for logging (aggregation is handled in monitor.py)
         order_id = fill_data.get('oid')
         
-        symbol = fill_data.get('coin', '')
+        symbol = _sym(fill_data.get('coin', ''))
         side_str = fill_data.get('side', '')  # 'B' for buy, 'A' for sell/ask
         target_size = abs(float(fill_data.get('sz', 0)))
         price = float(fill_data.get('px', 0))
@@ -555,24 +877,34 @@ async def on_order_fill(fill_data: dict):
         # Note: Partial fills are aggregated by order ID in monitor.py before this function is called
         logger.debug(f"📊 Fill details: order_id={order_id}, size={target_size}, startPosition={start_position}")
         
+        # Early bail on dust fills: project our notional conservatively
+        # (0.8 safety factor) before paying the position fetch and sizing
+        # pipeline just to discard the order at the $10 floor. Only valid
+        # in proportional mode - fixed sizing ignores the balance ratio
+        ctx = get_sizing_context()
+        if SIZING_MODE == "proportional" and ctx.ratio > 0:
+            projected_notional = target_size * price * ctx.ratio
+            if projected_notional < MIN_ORDER_VALUE * 0.8:
+                logger.debug(
+                    f"Skipping dust fill for {symbol}: projected ${projected_notional:.2f} "
+                    f"< ${MIN_ORDER_VALUE} minimum"
+                )
+                return
+        
         # Determine if this was likely a market or limit order
         order_type = "LIMIT" if crossed else "MARKET"
         
-        # Determine if this is an OPEN or CLOSE
-        is_closing = "Close" in direction
+        # One indexed lookup serves both the sizing and leverage reads below
+        target_pos = monitor.last_positions_by_symbol.get(symbol) if monitor else None
         
-        # Convert side to PositionSide
-        if "Long" in direction:
-            position_side = PositionSide.LONG
-        elif "Short" in direction:
-            position_side = PositionSide.SHORT
-        else:
-            # Fallback: Use side indicator
-            position_side = PositionSide.LONG if side_str == "B" else PositionSide.SHORT
+        # Normalize the textual direction once; side/closing fall out of
+        # a single table lookup instead of repeated substring scans
+        fill_direction = FillDirection.from_wire(direction, side_str)
+        position_side, order_side, is_closing = _FILL_LUT[fill_direction]
         
-        logger.info(f"\n{'='*50}")
+        logger.info("\n" + _BANNER_50)
         logger.info(f"📋 FILL TO COPY - {'CLOSE' if is_closing else 'OPEN'}")
-        logger.info(f"{'='*50}")
+        logger.info(_BANNER_50)
         logger.info(f"Symbol: {symbol}")
         logger.info(f"Direction: {direction}")
         logger.info(f"Target Order Type: {order_type}")
@@ -585,11 +917,11 @@ async def on_order_fill(fill_data: dict):
         your_position_size = 0.0
         your_position_side = None
         
-        if not settings.simulated_trading:
+        if not SIMULATED_TRADING:
             try:
-                your_positions_cache = await executor.get_my_positions()
-                if symbol in your_positions_cache:
-                    your_pos = your_positions_cache[symbol]
+                positions = await get_your_positions()
+                if symbol in positions:
+                    your_pos = positions[symbol]
                     your_position_size = your_pos["size"]
                     your_position_side = your_pos["side"]
                     logger.info(f"📊 YOUR current {symbol} position: {your_position_size:.6f} {your_position_side}")
@@ -597,9 +929,10 @@ async def on_order_fill(fill_data: dict):
                 logger.warning(f"Could not fetch your positions: {e}")
         else:
             # Use simulated position tracking
-            if symbol in simulated_positions:
-                your_position_size = abs(simulated_positions[symbol].get('size', 0))
-                your_position_side = simulated_positions[symbol].get('side', None)
+            if symbol in state.simulated_positions:
+                sim_pos = state.simulated_positions[symbol]
+                your_position_size = abs(sim_pos.size)
+                your_position_side = sim_pos.side or None
                 logger.info(f"📊 YOUR simulated {symbol} position: {your_position_size:.6f} {your_position_side}")
         
         # ============================================
@@ -612,8 +945,8 @@ async def on_order_fill(fill_data: dict):
                 return
             
             # Calculate proportional close amount based on target's partial close ratio
-            target_state = monitor.current_state
-            target_position_before = float(fill_data.get('startPosition', 0))
+            # start_position was parsed once at function entry
+            target_position_before = start_position
             
             if abs(target_position_before) > 0:
                 # How much of target's position is being closed (as a ratio)?
@@ -622,11 +955,14 @@ async def on_order_fill(fill_data: dict):
                 # Apply same ratio to YOUR position
                 our_size = your_position_size * close_ratio
                 
-                logger.info(f"📊 Close Sizing:")
-                logger.info(f"   Target had: {abs(target_position_before):.6f}")
-                logger.info(f"   Target closing: {target_size:.6f} ({close_ratio*100:.1f}%)")
-                logger.info(f"   Your position: {your_position_size:.6f}")
-                logger.info(f"   → You close: {our_size:.6f} ({close_ratio*100:.1f}% of yours)")
+                logger.opt(lazy=True).debug(
+                    "Close sizing: target had {tb:.6f}, closing {ts:.6f} ({cr:.1f}%), yours {yp:.6f} -> close {os:.6f}",
+                    tb=lambda: abs(target_position_before),
+                    ts=lambda: target_size,
+                    cr=lambda: close_ratio * 100,
+                    yp=lambda: your_position_size,
+                    os=lambda: our_size
+                )
             else:
                 # Full close - close your entire position
                 our_size = your_position_size
@@ -638,13 +974,7 @@ async def on_order_fill(fill_data: dict):
                 our_size = your_position_size
         else:
             # FOR OPENS: Use proportional sizing as before
-            # Get target position to calculate our size
-            target_position = None
-            if monitor.current_state:
-                for pos in monitor.current_state.positions:
-                    if pos.symbol == symbol:
-                        target_position = pos
-                        break
+            target_position = target_pos
             
             if not target_position:
                 # Create a placeholder position for sizing calculation
@@ -660,25 +990,25 @@ async def on_order_fill(fill_data: dict):
                     liquidation_price=0.0
                 )
             
-            # Calculate our fill size using YOUR actual wallet balance
-            target_balance = monitor.current_state.balance if monitor.current_state else 1000000
-            
-            expected_ratio = your_actual_balance / target_balance if target_balance > 0 else 0
+            # Calculate our fill size from the cached balance snapshot
+            ctx = get_sizing_context()
+            expected_ratio = ctx.ratio
             
             logger.debug(f"🔍 Sizing calculation: Target ${target_position.size * target_position.entry_price:,.2f} @ {expected_ratio:.2f}x ratio")
 
             our_size = position_sizer.calculate_size(
                 target_position=target_position,
-                target_wallet_balance=target_balance,
-                your_wallet_balance=your_actual_balance if your_actual_balance > 0 else simulated_balance
+                target_wallet_balance=ctx.target_balance,
+                your_wallet_balance=ctx.our_balance
             )
             
-            logger.info(f"📊 Open Sizing:")
-            logger.info(f"   Target Size: {target_size:.6f}")
-            logger.info(f"   Our Size: {our_size:.6f}")
-            if our_size and target_size > 0:
-                actual_ratio = (our_size * price) / (target_size * price)
-                logger.info(f"   Actual Ratio: {actual_ratio:.2f}x (should be {expected_ratio:.2f}x)")
+            logger.opt(lazy=True).debug(
+                "Open sizing: target {ts:.6f} -> ours {os:.6f}",
+                ts=lambda: target_size,
+                os=lambda: our_size
+            )
+            if our_size and target_size > 0 and expected_ratio > 0:
+                actual_ratio = our_size / target_size
                 if abs(actual_ratio - expected_ratio) / expected_ratio > 0.1:  # More than 10% difference
                     logger.error(f"   ⚠️ RATIO MISMATCH! Expected {expected_ratio:.2f}x but got {actual_ratio:.2f}x")
         
@@ -690,44 +1020,34 @@ async def on_order_fill(fill_data: dict):
         # MINIMUM ORDER VALUE CHECK ($10 on Hyperliquid)
         # ============================================
         order_value = our_size * price
-        MIN_ORDER_VALUE = 10.0
         
         if order_value < MIN_ORDER_VALUE:
             logger.warning(f"⚠️ Order value ${order_value:.2f} < minimum ${MIN_ORDER_VALUE}. Skipping (too small).")
             return
         
-        # Get target leverage
-        target_leverage = 1.0
-        if monitor.current_state:
-            for pos in monitor.current_state.positions:
-                if pos.symbol == symbol:
-                    target_leverage = pos.leverage
-                    break
-        
-        # Use SAME leverage as target for true proportional copying
-        our_leverage = calculate_matching_leverage(
-            target_leverage=target_leverage,
-            symbol=symbol
-        )
+        # Leverage comes from the precomputed sizing view when the
+        # symbol was in the last state refresh; fall back to computing it
+        sizing_view = sizing_cache.get(symbol)
+        if sizing_view is not None:
+            our_leverage = sizing_view.your_leverage
+        else:
+            target_leverage = target_pos.leverage if target_pos else 1.0
+            our_leverage = calculate_matching_leverage(
+                target_leverage=target_leverage,
+                symbol=symbol
+            )
         
-        logger.info(f"   Target Leverage: {target_leverage}x")
         logger.info(f"   Our Leverage: {our_leverage}x")
         
-        # Determine order type based on settings
-        use_limit = settings.copy_rules.use_limit_orders
+        # Determine order type based on settings (module-level snapshot)
+        use_limit = USE_LIMIT_ORDERS
         
         if use_limit:
             logger.info(f"   Order Type: LIMIT @ ${price:,.4f}")
         else:
             logger.info(f"   Order Type: MARKET")
         
-        # Convert PositionSide to OrderSide based on direction
-        # Open Long = BUY, Close Long = SELL, Open Short = SELL, Close Short = BUY
-        if "Open" in direction:
-            order_side = OrderSide.BUY if position_side == PositionSide.LONG else OrderSide.SELL
-        else:  # Close
-            order_side = OrderSide.SELL if position_side == PositionSide.LONG else OrderSide.BUY
-        
+        # order_side already resolved by the direction table above
         logger.info(f"   Order Side: {order_side.value}")
         logger.info(f"   Reduce Only: {is_closing}")
         
@@ -754,86 +1074,115 @@ async def on_order_fill(fill_data: dict):
         
         if result:
             logger.success(f"✅ Fill copied successfully!")
-            trades_copied_count += 1
+            state.trades_copied_count += 1
             
-            # Update simulated position
-            if settings.simulated_trading:
-                position_value = our_size * price
-                margin_required = position_value / our_leverage
+            # Keep the local positions snapshot warm with our own fill
+            if not SIMULATED_TRADING:
+                apply_fill_to_your_cache(
+                    symbol, position_side.value.upper(), our_size, price, is_closing
+                )
+            
+            # Update simulated position (locked: workers run concurrently)
+            if SIMULATED_TRADING:
+                async with sim_lock:
+                    # One multiply, one cached abs, and a reciprocal in
+                    # place of the per-fill division
+                    position_value = our_size * price
+                    margin_required = position_value * (1.0 / our_leverage)
+                    is_long = position_side is _LONG
                 
-                if symbol not in simulated_positions:
-                    simulated_positions[symbol] = {
-                        'size': 0,
-                        'entry_price': 0,
-                        'leverage': our_leverage,
-                        'side': position_side.value
-                    }
+                    if symbol not in state.simulated_positions:
+                        state.simulated_positions[symbol] = SimulatedPosition(
+                            leverage=our_leverage,
+                            side=position_side.value
+                        )
                 
-                pos = simulated_positions[symbol]
+                    pos = state.simulated_positions[symbol]
+                    abs_size = abs(pos.size)
                 
-                # Update position based on direction
-                if "Open" in direction:
-                    # Opening new position or adding to existing
-                    total_value = (abs(pos['size']) * pos['entry_price']) + position_value
-                    new_size = abs(pos['size']) + our_size
-                    pos['entry_price'] = total_value / new_size if new_size > 0 else price
-                    pos['size'] = new_size if position_side == PositionSide.LONG else -new_size
-                    pos['side'] = position_side.value
-                elif "Close" in direction:
-                    # Closing position
-                    pos['size'] = abs(pos['size']) - our_size
-                    if position_side == PositionSide.SHORT:
-                        pos['size'] = -pos['size']
-                    if abs(pos['size']) < 0.0001:  # Effectively zero
-                        del simulated_positions[symbol]
-                        logger.info(f"   Position {symbol} closed")
+                    # Update position based on direction
+                    if not is_closing:
+                        # Opening new position or adding to existing
+                        total_value = abs_size * pos.entry_price + position_value
+                        new_size = abs_size + our_size
+                        pos.entry_price = total_value / new_size if new_size > 0 else price
+                        pos.size = new_size if is_long else -new_size
+                        pos.side = position_side.value
+                    else:
+                        # Closing position
+                        new_size = abs_size - our_size
+                        pos.size = new_size if is_long else -new_size
+                        if abs(pos.size) < 0.0001:  # Effectively zero
+                            del state.simulated_positions[symbol]
+                            logger.info(f"   Position {symbol} closed")
                 
-                logger.success(f"\n💰 SIMULATED FILL EXECUTED!")
-                logger.success(f"   Position: {symbol}")
-                if symbol in simulated_positions:
-                    logger.success(f"   New Size: {simulated_positions[symbol]['size']:.4f}")
-                    logger.success(f"   Entry Price: ${simulated_positions[symbol]['entry_price']:.2f}")
-                logger.success(f"   Margin Used: ${margin_required:,.2f}")
-                logger.success(f"   Account Balance: ${simulated_balance:,.2f}")
+                    logger.success(f"\n💰 SIMULATED FILL EXECUTED!")
+                    logger.success(f"   Position: {symbol}")
+                    if symbol in state.simulated_positions:
+                        logger.success(f"   New Size: {state.simulated_positions[symbol].size:.4f}")
+                        logger.success(f"   Entry Price: ${state.simulated_positions[symbol].entry_price:.2f}")
+                    logger.success(f"   Margin Used: ${margin_required:,.2f}")
+                    logger.success(f"   Account Balance: ${state.simulated_balance:,.2f}")
             
             # Send notification
             if notifier:
-                await notifier.send_trade_notification(
+                fire_and_forget(notifier.send_trade_notification(
                     symbol=symbol,
                     side=position_side,
                     size=our_size,
                     entry_price=price,
                     leverage=our_leverage,
                     target_size=target_size
-                )
+                ), name=f"tg-{symbol}")
         else:
             logger.error(f"❌ Failed to copy fill")
             
-    except Exception as e:
-        logger.error(f"Error copying fill: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+    except Exception:
+        logger.exception("Error copying fill")
+
+
+# Rendered-message caches for the Telegram callbacks, keyed by a state
+# fingerprint - repeated polls between state changes reuse the string
+_status_cache = (None, None)  # (key, rendered)
+_pnl_cache = (None, None)
+
+
+def _state_fingerprint() -> tuple:
+    return (
+        monitor.state_version if monitor else 0,
+        state.is_paused,
+        state.simulated_balance,
+        state.simulated_pnl,
+        state.trades_copied_count,
+    )
 
 
 # Telegram bot callback functions
 async def get_status() -> str:
     """Get current bot status for Telegram"""
-    uptime = (datetime.now() - bot_start_time).total_seconds() / 3600 if bot_start_time else 0
+    global _status_cache
+    # Uptime advances even when nothing else changes, so the cache holds
+    # a template and the uptime is formatted fresh on every poll
+    uptime = (datetime.now() - state.bot_start_time).total_seconds() / 3600 if state.bot_start_time else 0
     
-    state = monitor.current_state if monitor else None
+    key = _state_fingerprint()
+    if _status_cache[0] == key:
+        return _status_cache[1].format(uptime=uptime)
+    
+    target_state = monitor.current_state if monitor else None
     
     if settings.simulated_trading:
-        balance = simulated_balance
-        pnl = simulated_pnl
+        balance = state.simulated_balance
+        pnl = state.simulated_pnl
     else:
-        balance = state.balance if state else 0
-        pnl = state.unrealized_pnl if state else 0
+        balance = target_state.balance if target_state else 0
+        pnl = target_state.unrealized_pnl if target_state else 0
     
-    status_emoji = "🟢" if not is_paused else "⏸️"
-    status_text = "ACTIVE" if not is_paused else "PAUSED"
+    status_emoji = "🟢" if not state.is_paused else "⏸️"
+    status_text = "ACTIVE" if not state.is_paused else "PAUSED"
     mode = "SIMULATED" if settings.simulated_trading else "LIVE"
     
-    return f"""
+    rendered = f"""
 📊 <b>Copy Trading Status</b>
 
 {status_emoji} <b>Status:</b> {status_text}
@@ -841,13 +1190,16 @@ async def get_status() -> str:
 👤 <b>Target:</b> <code>{settings.target_wallet[:10]}...{settings.target_wallet[-6:]}</code>
 💼 <b>Your Balance:</b> ${balance:,.2f}
 📈 <b>Session PnL:</b> ${pnl:,.2f}
-📊 <b>Trades Copied:</b> {trades_copied_count}
-📍 <b>Open Positions:</b> {len(simulated_positions) if settings.simulated_trading else (len(state.positions) if state else 0)}
-⏰ <b>Uptime:</b> {uptime:.1f}h
+📊 <b>Trades Copied:</b> {state.trades_copied_count}
+📍 <b>Open Positions:</b> {len(state.simulated_positions) if settings.simulated_trading else (len(target_state.positions) if target_state else 0)}
+⏰ <b>Uptime:</b> {{uptime:.1f}}h
 
 <b>Sizing Mode:</b> {settings.sizing.mode.title()}
 <b>Leverage:</b> {settings.leverage.adjustment_ratio}x of target
     """.strip()
+    
+    _status_cache = (key, rendered)
+    return rendered.format(uptime=uptime)
 
 
 def get_positions() -> list:
@@ -890,20 +1242,25 @@ def get_orders() -> list:
 
 async def get_pnl() -> str:
     """Get PnL for Telegram"""
-    state = monitor.current_state if monitor else None
+    global _pnl_cache
+    key = _state_fingerprint()
+    if _pnl_cache[0] == key:
+        return _pnl_cache[1]
+    
+    target_state = monitor.current_state if monitor else None
     
     if settings.simulated_trading:
-        balance = simulated_balance
-        equity = simulated_balance
-        pnl = simulated_pnl
+        balance = state.simulated_balance
+        equity = state.simulated_balance + simulated_unrealized_pnl()
+        pnl = state.simulated_pnl
         mode = "SIMULATED"
     else:
-        balance = state.balance if state else 0
-        equity = state.total_equity if state else 0
-        pnl = state.unrealized_pnl if state else 0
+        balance = target_state.balance if target_state else 0
+        equity = target_state.total_equity if target_state else 0
+        pnl = target_state.unrealized_pnl if target_state else 0
         mode = "LIVE"
     
-    return f"""
+    rendered = f"""
 💰 <b>Account PnL Summary</b>
 
 🎮 <b>Mode:</b> {mode}
@@ -914,46 +1271,50 @@ async def get_pnl() -> str:
 • Unrealized PnL: ${pnl:,.2f}
 
 <b>Session:</b>
-• Trades Copied: {trades_copied_count}
-• Open Positions: {len(simulated_positions) if settings.simulated_trading else (len(state.positions) if state else 0)}
+• Trades Copied: {state.trades_copied_count}
+• Open Positions: {len(state.simulated_positions) if settings.simulated_trading else (len(target_state.positions) if target_state else 0)}
     """.strip()
+    
+    _pnl_cache = (key, rendered)
+    return rendered
+
+
+def _fmt_position(i: int, pos) -> str:
+    """Render one position entry for the Telegram positions report"""
+    pnl_emoji = "📈" if pos.unrealized_pnl > 0 else "📉"
+    return (
+        f"{i}️⃣ <b>{pos.symbol}</b> {pos.side.value.upper()}\n"
+        f"   Size: {pos.size:.4f}\n"
+        f"   Entry: ${pos.entry_price:,.2f}\n"
+        f"   Current: ${pos.current_price:,.2f}\n"
+        f"   Leverage: {pos.leverage}x\n"
+        f"   PnL: {pnl_emoji} ${pos.unrealized_pnl:,.2f} ({pos.pnl_percentage:+.2f}%)\n"
+    )
 
 
 async def get_positions_formatted() -> str:
     """Get current positions for Telegram"""
-    state = monitor.current_state if monitor else None
+    target_state = monitor.current_state if monitor else None
     
-    if not state or not state.positions:
+    if not target_state or not target_state.positions:
         return "📍 <b>Open Positions</b>\n\nNo open positions."
     
-    message = f"📍 <b>Open Positions ({len(state.positions)})</b>\n\n"
+    # list + single join instead of quadratic += reallocation
+    parts = [f"📍 <b>Open Positions ({len(target_state.positions)})</b>\n"]
+    parts.extend(_fmt_position(i, pos) for i, pos in enumerate(target_state.positions, 1))
     
-    for i, pos in enumerate(state.positions, 1):
-        pnl_emoji = "📈" if pos.unrealized_pnl > 0 else "📉"
-        message += f"""
-{i}️⃣ <b>{pos.symbol}</b> {pos.side.value.upper()}
-   Size: {pos.size:.4f}
-   Entry: ${pos.entry_price:,.2f}
-   Current: ${pos.current_price:,.2f}
-   Leverage: {pos.leverage}x
-   PnL: {pnl_emoji} ${pos.unrealized_pnl:,.2f} ({pos.pnl_percentage:+.2f}%)
-
-"""
-    
-    return message.strip()
+    return "\n".join(parts).strip()
 
 
 async def handle_pause():
     """Handle pause request from Telegram"""
-    global is_paused
-    is_paused = True
+    state.is_paused = True
     logger.warning("⏸️ Bot paused by Telegram command")
 
 
 async def handle_resume():
     """Handle resume request from Telegram"""
-    global is_paused
-    is_paused = False
+    state.is_paused = False
     logger.info("▶️ Bot resumed by Telegram command")
 
 
@@ -961,15 +1322,39 @@ async def handle_stop(close_positions: bool = False):
     """Handle stop request from Telegram"""
     logger.warning(f"🛑 Stop requested from Telegram (close_positions={close_positions})")
     
-    # Cancel all orders
+    # Cancel everything and close positions concurrently - a panic stop
+    # must not pay one round-trip per position. Bounded so a dead
+    # exchange can't block shutdown indefinitely
     if executor:
-        await executor.cancel_all_orders()
+        close_calls = []
+        labels = ["cancel_all"]
+        if close_positions and monitor and monitor.current_state:
+            for pos in monitor.current_state.positions:
+                logger.info(f"Closing position: {pos.symbol}")
+                close_calls.append(executor.close_position(
+                    pos.symbol,
+                    abs(pos.size),
+                    OrderSide.SELL if pos.side == PositionSide.LONG else OrderSide.BUY
+                ))
+                labels.append(pos.symbol)
+        
+        try:
+            results = await asyncio.wait_for(
+                asyncio.gather(
+                    executor.cancel_all_orders(),
+                    *close_calls,
+                    return_exceptions=True
+                ),
+                timeout=10
+            )
+            for label, result in zip(labels, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Stop step {label} failed: {result}")
+        except asyncio.TimeoutError:
+            logger.error("Timed out waiting for cancel/close during stop")
     
-    # Close positions if requested
-    if close_positions and monitor and monitor.current_state:
-        for pos in monitor.current_state.positions:
-            logger.info(f"Closing position: {pos.symbol}")
-            await executor.close_position(pos.symbol)
+    # Wake the hourly reporter (and any other waiters) immediately
+    _shutdown_event.set()
     
     # Stop monitoring
     if monitor:
@@ -979,26 +1364,33 @@ async def handle_stop(close_positions: bool = False):
     if telegram_bot:
         await telegram_bot.stop()
     
-    # Exit
-    import sys
     sys.exit(0)
 
 
+# Set at startup; handle_stop sets it so waiters wake immediately
+# instead of lingering up to an hour in a fixed sleep
+_shutdown_event = asyncio.Event()
+
+
 async def send_hourly_reports():
-    """Send hourly reports via Telegram"""
+    """Send hourly reports via Telegram until shutdown is signalled"""
     while True:
         try:
-            await asyncio.sleep(3600)  # Wait 1 hour
+            try:
+                await asyncio.wait_for(_shutdown_event.wait(), timeout=3600)
+                break  # shutting down
+            except asyncio.TimeoutError:
+                pass  # hour elapsed - send the report
             
             if notifier and monitor and monitor.current_state:
-                state = monitor.current_state
+                target_state = monitor.current_state
                 
                 await notifier.send_hourly_report(
-                    trades_copied=trades_copied_count,
-                    account_pnl_usd=state.unrealized_pnl,
-                    account_pnl_pct=(state.unrealized_pnl / state.balance * 100) if state.balance > 0 else 0,
-                    open_positions=len(state.positions),
-                    open_orders=len(state.orders),
+                    trades_copied=state.trades_copied_count,
+                    account_pnl_usd=target_state.unrealized_pnl,
+                    account_pnl_pct=(target_state.unrealized_pnl / target_state.balance * 100) if target_state.balance > 0 else 0,
+                    open_positions=len(target_state.positions),
+                    open_orders=len(target_state.orders),
                     target_wallet=settings.target_wallet
                 )
         except Exception as e:
@@ -1008,35 +1400,48 @@ async def main():
     """
     Main entry point for the copy trading bot
     """
-    global monitor, executor, position_sizer, client, telegram_bot, notifier, bot_start_time
-    global simulated_balance, trades_copied_count
+    global monitor, executor, position_sizer, client, telegram_bot, notifier
     
-    bot_start_time = datetime.now()
-    trades_copied_count = 0
+    state.bot_start_time = datetime.now()
+    state.trades_copied_count = 0
     
     # Initialize simulated account
-    simulated_balance = settings.simulated_account_balance
+    state.simulated_balance = settings.simulated_account_balance
     
-    logger.info("=" * 60)
+    logger.info(_BANNER_60)
     logger.info("🚀 Hyperliquid Copy Trading Bot Starting...")
-    logger.info("=" * 60)
+    logger.info(_BANNER_60)
     
     if settings.simulated_trading:
         logger.warning("🎮 SIMULATED TRADING MODE")
-        logger.warning(f"💰 Simulated Account Balance: ${simulated_balance:,.2f}")
+        logger.warning(f"💰 Simulated Account Balance: ${state.simulated_balance:,.2f}")
     else:
         logger.warning("⚠️ LIVE TRADING MODE - REAL MONEY AT RISK!")
     
     target_wallet = settings.target_wallet
     logger.info(f"📍 Target Wallet: {target_wallet}")
     
+    # One shared HTTP session for every subsystem hitting the API - all
+    # REST and exchange calls reuse a single warm connection pool
+    import aiohttp
+    http_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=128,
+            limit_per_host=32,
+            keepalive_timeout=75,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True
+        )
+    )
+    
     # Initialize components
-    client = HyperliquidClient(settings.hyperliquid.api_url)
+    client = HyperliquidClient(settings.hyperliquid.api_url, session=http_session)
     
     monitor = WalletMonitor(
         target_wallet,
         settings.hyperliquid.api_url,
-        settings.hyperliquid.ws_url
+        settings.hyperliquid.ws_url,
+        session=http_session
     )
     
     executor = TradeExecutor(
@@ -1044,52 +1449,58 @@ async def main():
         exchange_url=f"{settings.hyperliquid.api_url}/exchange",
         wallet_address=settings.hyperliquid.wallet_address,
         private_key=settings.hyperliquid.private_key,
-        dry_run=settings.simulated_trading
+        dry_run=settings.simulated_trading,
+        session=http_session
     )
     
     # Fetch YOUR actual wallet balance for proportional sizing
-    global your_actual_balance
     if not settings.simulated_trading:
         try:
-            your_actual_balance = await executor.get_account_balance()
-            logger.success(f"💰 Your wallet balance: ${your_actual_balance:,.2f}")
+            # Pre-warm asset metadata so the first copied order doesn't
+            # pay the meta round-trip
+            await executor.prime()
+        except Exception as e:
+            logger.warning(f"Could not prime asset metadata: {e}")
+        try:
+            state.your_actual_balance = await executor.get_account_balance()
+            logger.success(f"💰 Your wallet balance: ${state.your_actual_balance:,.2f}")
         except Exception as e:
             logger.warning(f"Could not fetch your balance: {e}, using simulated balance")
-            your_actual_balance = simulated_balance
+            state.your_actual_balance = state.simulated_balance
     else:
-        your_actual_balance = simulated_balance
+        state.your_actual_balance = state.simulated_balance
     
     # Fetch target wallet state to auto-calculate ratio
     logger.info(f"\n📊 Fetching initial state...")
-    state = await monitor.get_current_state()
+    target_state = await monitor.get_current_state()
     
-    if state:
-        target_balance = state.balance
+    if target_state:
+        target_balance = target_state.balance
         logger.info(f"\n💼 Target Account:")
         logger.info(f"   Balance: ${target_balance:,.2f}")
-        logger.info(f"   Equity: ${state.total_equity:,.2f}")
-        logger.info(f"   Unrealized PnL: ${state.unrealized_pnl:,.2f}")
-        logger.info(f"   Open Positions: {len(state.positions)}")
+        logger.info(f"   Equity: ${target_state.total_equity:,.2f}")
+        logger.info(f"   Unrealized PnL: ${target_state.unrealized_pnl:,.2f}")
+        logger.info(f"   Open Positions: {len(target_state.positions)}")
         
         # Auto-calculate ratio based on balances (YOUR balance / TARGET balance)
-        auto_ratio = your_actual_balance / target_balance if target_balance > 0 else 1.0
+        auto_ratio = state.your_actual_balance / target_balance if target_balance > 0 else 1.0
         settings.sizing.portfolio_ratio = auto_ratio
         
         logger.success(f"\n✨ AUTO-CALCULATED SIZING:")
         logger.success(f"   Target Balance: ${target_balance:,.2f}")
-        logger.success(f"   Your Balance: ${your_actual_balance:,.2f}")
+        logger.success(f"   Your Balance: ${state.your_actual_balance:,.2f}")
         logger.success(f"   📊 Ratio: {auto_ratio:.2f}x (Your trades are {auto_ratio:.2f}x larger than target)")
         if auto_ratio >= 1:
             logger.success(f"   This means: Target opens $100, you copy ${100*auto_ratio:.0f}")
         else:
             logger.success(f"   This means: Target opens $100, you copy ${100*auto_ratio:.2f}")
         
-        if state.positions:
+        if target_state.positions:
             logger.info(f"\n📊 Current Positions:")
-            logger.info(f"=" * 60)
+            logger.info(_BANNER_60)
             
             total_simulated_margin = 0
-            for i, pos in enumerate(state.positions, 1):
+            for i, pos in enumerate(target_state.positions, 1):
                 target_position_value = abs(pos.size) * pos.entry_price
                 your_position_value = target_position_value * auto_ratio
                 your_size = your_position_value / pos.entry_price if pos.entry_price > 0 else 0
@@ -1107,12 +1518,12 @@ async def main():
                 logger.success(f"   → Your Value: ${your_position_value:,.2f}")
                 logger.success(f"   → Margin Needed: ${margin_needed:,.2f}")
             
-            logger.info(f"\n" + "=" * 60)
-            logger.warning(f"📊 If you copied all {len(state.positions)} positions:")
+            logger.info("\n" + _BANNER_60)
+            logger.warning(f"📊 If you copied all {len(target_state.positions)} positions:")
             logger.warning(f"   Total Margin Needed: ${total_simulated_margin:,.2f}")
-            logger.warning(f"   Your Balance: ${simulated_balance:,.2f}")
-            logger.warning(f"   Remaining: ${simulated_balance - total_simulated_margin:,.2f}")
-            logger.info(f"=" * 60)
+            logger.warning(f"   Your Balance: ${state.simulated_balance:,.2f}")
+            logger.warning(f"   Remaining: ${state.simulated_balance - total_simulated_margin:,.2f}")
+            logger.info(_BANNER_60)
     
     logger.info(f"\n🔧 Copy Trading Settings:")
     logger.info(f"   Sizing Mode: {settings.sizing.mode}")
@@ -1127,7 +1538,21 @@ async def main():
         max_total_exposure=settings.sizing.max_total_exposure
     )
     
+    # The auto-calculated ratio is final now - bind the per-trade size
+    # fast path against it
+    bind_sizing_fast_path()
+    
+    # Start the fill-copy worker pool, one queue shard per worker
+    global fill_queues
+    fill_queues = [asyncio.Queue() for _ in range(FILL_WORKER_COUNT)]
+    fill_workers = [
+        asyncio.create_task(_fill_worker(queue), name=f"fill-worker-{i}")
+        for i, queue in enumerate(fill_queues)
+    ]
+    
     # Set up callbacks
+    monitor.on_state_refresh = lambda st: rebuild_sizing_cache(st.positions)
+    rebuild_sizing_cache(target_state.positions if target_state else [])
     monitor.on_new_position = on_new_position
     monitor.on_position_close = on_position_close
     monitor.on_position_update = on_position_update
@@ -1135,15 +1560,27 @@ async def main():
     monitor.on_order_fill = on_order_fill
     
     # Copy existing positions if enabled
-    if settings.copy_rules.copy_open_positions and state and state.positions:
-        logger.info("=" * 60)
+    if settings.copy_rules.copy_open_positions and target_state and target_state.positions:
+        logger.info(_BANNER_60)
         logger.success("🔄 COPYING EXISTING POSITIONS ON STARTUP")
-        logger.info("=" * 60)
-        
-        copied_count = 0
-        for i, pos in enumerate(state.positions, 1):
-            try:
-                # Calculate your copy
+        logger.info(_BANNER_60)
+        
+        # Submit all startup copies concurrently - N sequential round
+        # trips become one overlapped batch, bounded by a semaphore so we
+        # don't slam the exchange endpoint
+        startup_sem = asyncio.Semaphore(4)
+        
+        async def _copy_one(i: int, pos):
+            """Size and submit the copy for one existing target position"""
+            # The sizing cache was built in one pass over this same state
+            # snapshot - reuse it instead of re-deriving per position
+            sizing_view = sizing_cache.get(pos.symbol)
+            if sizing_view is not None:
+                your_size = sizing_view.your_size
+                your_leverage = sizing_view.your_leverage
+                margin_needed = sizing_view.margin_needed
+                your_position_value = sizing_view.target_value * auto_ratio
+            else:
                 target_position_value = abs(pos.size) * pos.entry_price
                 your_position_value = target_position_value * auto_ratio
                 your_size = your_position_value / pos.entry_price if pos.entry_price > 0 else 0
@@ -1152,86 +1589,98 @@ async def main():
                     symbol=pos.symbol
                 )
                 margin_needed = your_position_value / your_leverage
-                
-                logger.info(f"\n📊 Copying Position {i}/{len(state.positions)}: {pos.symbol}")
-                logger.info(f"   Target: {pos.size:.4f} @ ${pos.entry_price:,.2f} ({pos.leverage}x)")
-                logger.info(f"   Target Value: ${target_position_value:,.2f}")
-                logger.success(f"   → Your Size: {your_size:.4f} @ ${pos.entry_price:,.2f} ({your_leverage}x)")
-                logger.success(f"   → Your Value: ${your_position_value:,.2f}")
-                logger.success(f"   → Margin: ${margin_needed:,.2f}")
-                
-                # Execute the copy
-                side = PositionSide.LONG if pos.size > 0 else PositionSide.SHORT
+            
+            logger.info(f"\n📊 Copying Position {i}/{len(target_state.positions)}: {pos.symbol}")
+            logger.info(f"   Target: {pos.size:.4f} @ ${pos.entry_price:,.2f} ({pos.leverage}x)")
+            logger.success(f"   → Your Size: {your_size:.4f} @ ${pos.entry_price:,.2f} ({your_leverage}x)")
+            logger.success(f"   → Your Value: ${your_position_value:,.2f} (margin ${margin_needed:,.2f})")
+            
+            # Execute the copy
+            side = PositionSide.LONG if pos.size > 0 else PositionSide.SHORT
+            async with startup_sem:
                 result = await executor.execute_market_order(
                     symbol=pos.symbol,
                     side=side,
                     size=your_size,
                     leverage=your_leverage
                 )
+            return pos, side, your_size, your_position_value, your_leverage, margin_needed, result
+        
+        copied_count = 0
+        results = await asyncio.gather(
+            *[_copy_one(i, pos) for i, pos in enumerate(target_state.positions, 1)],
+            return_exceptions=True
+        )
+        
+        for outcome in results:
+            if isinstance(outcome, Exception):
+                logger.error(f"   ❌ Error copying position: {outcome}")
+                continue
+            
+            pos, side, your_size, your_position_value, your_leverage, margin_needed, result = outcome
+            if result:
+                # Update simulated account
+                if settings.simulated_trading:
+                    state.simulated_positions[pos.symbol] = SimulatedPosition(
+                        size=your_size if side == PositionSide.LONG else -your_size,
+                        entry_price=pos.entry_price,
+                        side=side.value.upper(),
+                        leverage=your_leverage,
+                        value=your_position_value,
+                        margin_used=margin_needed
+                    )
                 
-                if result:
-                    # Update simulated account
-                    if settings.simulated_trading:
-                        simulated_positions[pos.symbol] = {
-                            'size': your_size if side == PositionSide.LONG else -your_size,
-                            'entry_price': pos.entry_price,
-                            'side': side.value.upper(),
-                            'leverage': your_leverage,
-                            'value': your_position_value,
-                            'margin_used': margin_needed
-                        }
-                    
-                    copied_count += 1
-                    logger.success(f"   ✅ Position copied successfully!")
-                else:
-                    logger.error(f"   ❌ Failed to copy position")
-                    
-            except Exception as e:
-                logger.error(f"   ❌ Error copying position {pos.symbol}: {e}")
+                copied_count += 1
+                logger.success(f"   ✅ {pos.symbol} copied successfully!")
+            else:
+                logger.error(f"   ❌ Failed to copy {pos.symbol}")
         
-        # Show final account state
+        # Show final account target_state
         if settings.simulated_trading:
-            total_margin_used = sum(p['margin_used'] for p in simulated_positions.values())
-            logger.info("\n" + "=" * 60)
+            total_margin_used = sum(p.margin_used for p in state.simulated_positions.values())
+            logger.info("\n" + _BANNER_60)
             logger.success("✅ EXISTING POSITIONS COPIED!")
-            logger.info("=" * 60)
+            logger.info(_BANNER_60)
             logger.success(f"💰 Simulated Account Update:")
-            logger.success(f"   Total Positions Copied: {copied_count}/{len(state.positions)}")
+            logger.success(f"   Total Positions Copied: {copied_count}/{len(target_state.positions)}")
             logger.success(f"   Total Margin Used: ${total_margin_used:,.2f}")
-            logger.success(f"   Account Balance: ${simulated_balance:,.2f}")
-            logger.success(f"   Available Balance: ${simulated_balance - total_margin_used:,.2f}")
-            logger.info("=" * 60)
+            logger.success(f"   Account Balance: ${state.simulated_balance:,.2f}")
+            logger.success(f"   Available Balance: ${state.simulated_balance - total_margin_used:,.2f}")
+            logger.info(_BANNER_60)
         
         # Update global counter
-        trades_copied_count += copied_count
+        state.trades_copied_count += copied_count
     
     # Copy existing orders if enabled
-    if settings.copy_rules.copy_existing_orders and state and state.orders:
-        logger.info("\n" + "=" * 60)
+    if settings.copy_rules.copy_existing_orders and target_state and target_state.orders:
+        logger.info("\n" + _BANNER_60)
         logger.success("📋 COPYING EXISTING ORDERS ON STARTUP")
-        logger.info("=" * 60)
+        logger.info(_BANNER_60)
         
-        for i, order in enumerate(state.orders, 1):
-            try:
-                # Skip if price is None
-                if order.price is None or order.price <= 0:
-                    logger.warning(f"   ⚠️ Skipping order {order.symbol} - invalid price")
-                    continue
-                
-                # Calculate your order size
-                target_order_value = order.size * order.price
-                your_order_value = target_order_value * auto_ratio
-                your_size = your_order_value / order.price
-                your_leverage = 1.0  # Default leverage for orders
-                
-                logger.info(f"\n📝 Copying Order {i}/{len(state.orders)}: {order.symbol}")
-                logger.info(f"   Target: {order.size:.4f} @ ${order.price:,.2f}")
-                logger.success(f"   → Your Size: {your_size:.4f} @ ${order.price:,.2f}")
-                
-                # Convert OrderSide to PositionSide
-                position_side = PositionSide.LONG if order.side == OrderSide.BUY else PositionSide.SHORT
-                
-                # Execute the order
+        order_sem = asyncio.Semaphore(4)
+        
+        async def _copy_order(i: int, order):
+            """Size and submit the copy for one existing target order"""
+            # Skip if price is None
+            if order.price is None or order.price <= 0:
+                logger.warning(f"   ⚠️ Skipping order {order.symbol} - invalid price")
+                return
+            
+            # Calculate your order size
+            target_order_value = order.size * order.price
+            your_order_value = target_order_value * auto_ratio
+            your_size = your_order_value / order.price
+            your_leverage = 1.0  # Default leverage for orders
+            
+            logger.info(f"\n📝 Copying Order {i}/{len(target_state.orders)}: {order.symbol}")
+            logger.info(f"   Target: {order.size:.4f} @ ${order.price:,.2f}")
+            logger.success(f"   → Your Size: {your_size:.4f} @ ${order.price:,.2f}")
+            
+            # Convert OrderSide to PositionSide
+            position_side = PositionSide.LONG if order.side == OrderSide.BUY else PositionSide.SHORT
+            
+            # Execute the order
+            async with order_sem:
                 result = await executor.execute_limit_order(
                     symbol=order.symbol,
                     side=position_side,
@@ -1239,24 +1688,32 @@ async def main():
                     price=order.price,
                     leverage=your_leverage
                 )
-                
-                if result:
-                    logger.success(f"   ✅ Order copied successfully!")
-                else:
-                    logger.error(f"   ❌ Failed to copy order")
-                    
-            except Exception as e:
-                logger.error(f"   ❌ Error copying order {order.symbol}: {e}")
+            
+            if result:
+                logger.success(f"   ✅ Order copied successfully!")
+            else:
+                logger.error(f"   ❌ Failed to copy order")
+        
+        order_results = await asyncio.gather(
+            *[_copy_order(i, order) for i, order in enumerate(target_state.orders, 1)],
+            return_exceptions=True
+        )
+        for outcome in order_results:
+            if isinstance(outcome, Exception):
+                logger.error(f"   ❌ Error copying order: {outcome}")
         
-        logger.info("=" * 60)
+        logger.info(_BANNER_60)
     
     # Initialize Telegram bot if configured
     if settings.telegram.bot_token and settings.telegram.chat_id:
         logger.info("🤖 Initializing Telegram bot...")
         
+        from utils.tg_queue import TGQueue
         notifier = NotificationService(
             settings.telegram.bot_token,
-            settings.telegram.chat_id
+            settings.telegram.chat_id,
+            queue=TGQueue(rate_per_sec=25),
+            session=http_session
         )
         
         telegram_bot = TelegramBot(
@@ -1276,34 +1733,34 @@ async def main():
         # Start Telegram bot
         await telegram_bot.start()
         
-        # Start hourly reports task
-        asyncio.create_task(send_hourly_reports())
+        # Start hourly reports task (kept for cancellation at shutdown)
+        hourly_task = asyncio.create_task(send_hourly_reports())
         
         logger.info("✅ Telegram bot ready!")
     else:
         logger.warning("⚠️ Telegram bot not configured (add TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID to .env)")
     
     try:
-        # Get initial state
+        # Get initial target_state
         logger.info(f"\n� Fetching initial state...")
-        state = await monitor.get_current_state()
+        target_state = await monitor.get_current_state()
         
-        if state:
+        if target_state:
             logger.info(f"\n💼 Target Account:")
-            logger.info(f"   Balance: ${state.balance:,.2f}")
-            logger.info(f"   Equity: ${state.total_equity:,.2f}")
-            logger.info(f"   Unrealized PnL: ${state.unrealized_pnl:,.2f}")
-            logger.info(f"   Open Positions: {len(state.positions)}")
+            logger.info(f"   Balance: ${target_state.balance:,.2f}")
+            logger.info(f"   Equity: ${target_state.total_equity:,.2f}")
+            logger.info(f"   Unrealized PnL: ${target_state.unrealized_pnl:,.2f}")
+            logger.info(f"   Open Positions: {len(target_state.positions)}")
             
-            if state.positions:
+            if target_state.positions:
                 logger.info(f"\n� Current Positions:")
-                for i, pos in enumerate(state.positions, 1):
+                for i, pos in enumerate(target_state.positions, 1):
                     logger.info(f"   {i}. {pos.symbol} {pos.side.value.upper()}: {pos.size} @ ${pos.entry_price:,.2f} ({pos.leverage}x)")
         
         # Copy existing open orders if configured
-        if settings.copy_rules.copy_existing_orders and state and state.orders:
-            logger.info(f"\n📋 Copying {len(state.orders)} existing orders...")
-            for order in state.orders:
+        if settings.copy_rules.copy_existing_orders and target_state and target_state.orders:
+            logger.info(f"\n📋 Copying {len(target_state.orders)} existing orders...")
+            for order in target_state.orders:
                 try:
                     order_dict = {
                         'coin': order.symbol,
@@ -1357,6 +1814,20 @@ async def main():
         if telegram_bot:
             await telegram_bot.stop()
         
+        # Flush any coalesced notifications still in the debounce window
+        if notifier:
+            await notifier.close()
+        
+        _shutdown_event.set()
+        for worker in fill_workers:
+            worker.cancel()
+        
+        # Let in-flight notifications finish before tearing down
+        if _bg_tasks:
+            await asyncio.gather(*_bg_tasks, return_exceptions=True)
+        
+        await http_session.close()
+        
         logger.info("👋 Bot stopped gracefully")
 
 if __name__ == "__main__":
@@ -1,75 +1,203 @@
 import asyncio
 from typing import Optional
 from datetime import datetime
-from telegram import Bot
+import aiohttp
+import orjson
 from loguru import logger
 
+from utils.tg_queue import TGQueue
+
 
 class NotificationService:
     """
     Service for sending Telegram notifications
     """
     
-    def __init__(self, bot_token: str, chat_id: str):
+    def __init__(
+        self,
+        bot_token: str,
+        chat_id: str,
+        queue: Optional[TGQueue] = None,
+        session: Optional[aiohttp.ClientSession] = None
+    ):
         """
         Initialize notification service
         
         Args:
             bot_token: Telegram bot token
             chat_id: Chat ID to send notifications to
+            queue: Optional rate-limited send queue; without it sends go
+                   straight to the Bot API
+            session: Optional shared aiohttp session (caller owns lifecycle)
         """
-        self.bot = Bot(token=bot_token)
         self.chat_id = chat_id
         self.enabled = True
+        self.queue = queue
+        
+        # Direct Bot API posting with a pre-built constant payload and
+        # orjson encoding - notifications only ever call sendMessage, so
+        # the full client library adds per-send overhead for nothing
+        self._api_url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+        self._base_payload = {
+            "chat_id": chat_id,
+            "parse_mode": "HTML",
+            "disable_web_page_preview": True,
+        }
+        self._session = session
+        self._owns_session = session is None
+        
+        # Burst coalescing for trade notifications - rapid fills collect
+        # for a short window and go out as one digest message
+        self._pending_trade_notifs = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_delay = 2.0
+        self._flush_max_batch = 10  # flush early to stay under the 4096-char cap
         
         logger.info(f"Notification service initialized for chat {chat_id}")
     
     async def send_message(self, message: str, parse_mode: str = "HTML") -> bool:
-        """Send a message to the configured chat"""
+        """Send a message to the configured chat
+        
+        With a queue configured the message is enqueued behind the rate
+        limiter and True means accepted, not delivered.
+        """
         if not self.enabled:
             logger.debug("Notifications disabled, skipping message")
             return False
         
-        try:
-            await self.bot.send_message(
-                chat_id=self.chat_id,
-                text=message,
-                parse_mode=parse_mode
+        if self.queue:
+            await self.queue.enqueue(
+                lambda: self._send_now(message, parse_mode), self.chat_id
             )
             return True
+        
+        return await self._send_now(message, parse_mode)
+    
+    async def _send_now(self, message: str, parse_mode: str) -> bool:
+        """Perform the actual Bot API call"""
+        try:
+            if self._session is None or self._session.closed:
+                self._session = aiohttp.ClientSession()
+                self._owns_session = True
+            
+            payload = self._base_payload | {"text": message}
+            if parse_mode != "HTML":
+                payload["parse_mode"] = parse_mode
+            
+            async with self._session.post(
+                self._api_url,
+                data=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"}
+            ) as response:
+                if response.status == 200:
+                    return True
+                body = await response.text()
+                logger.error(f"Failed to send Telegram message: {response.status} {body[:200]}")
+                return False
         except Exception as e:
             logger.error(f"Failed to send Telegram message: {e}")
             return False
     
+    async def flush(self):
+        """Send any digest still sitting in the debounce window"""
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self._flush_trade_notifications()
+        if self.queue:
+            await self.queue.join()
+    
+    async def close(self):
+        """Flush pending sends, then close the session if owned
+        
+        Without the flush, trades collected inside the debounce window
+        would be dropped at shutdown.
+        """
+        await self.flush()
+        if self._session and self._owns_session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
     async def send_trade_notification(
         self,
         symbol: str,
         side: str,
         size: float,
-        entry_price: float,
-        leverage: float,
-        target_size: float,
-        is_simulated: bool = True
+        entry_price: float = 0.0,
+        leverage: float = 1.0,
+        target_size: float = 0.0,
+        is_simulated: bool = True,
+        price: float = None
     ):
-        """Send notification about a copied trade"""
+        """Queue a copied-trade notification for the next digest flush
         
-        mode_emoji = "🧪" if is_simulated else "✅"
-        mode_text = "[SIMULATED]" if is_simulated else ""
+        Burst fills coalesce into one message instead of a send storm.
+        """
+        self._pending_trade_notifs.append({
+            'symbol': symbol,
+            # Callers pass either a plain string or a PositionSide/OrderSide
+            # enum; unwrap to the value so the label renders as LONG/SHORT
+            'side': getattr(side, 'value', side).upper(),
+            'size': size,
+            'entry_price': price if price is not None else entry_price,
+            'leverage': leverage,
+            'target_size': target_size,
+            'is_simulated': is_simulated,
+        })
         
-        message = f"""
+        if len(self._pending_trade_notifs) >= self._flush_max_batch:
+            # Too big for one debounce window - flush right away
+            if self._flush_task and not self._flush_task.done():
+                self._flush_task.cancel()
+                self._flush_task = None
+            await self._flush_trade_notifications()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after_delay())
+    
+    async def _flush_after_delay(self):
+        try:
+            await asyncio.sleep(self._flush_delay)
+            await self._flush_trade_notifications()
+        except asyncio.CancelledError:
+            pass
+    
+    async def _flush_trade_notifications(self):
+        """Send everything collected so far as a single message"""
+        pending, self._pending_trade_notifs = self._pending_trade_notifs, []
+        if not pending:
+            return
+        
+        if len(pending) == 1:
+            trade = pending[0]
+            mode_emoji = "🧪" if trade['is_simulated'] else "✅"
+            mode_text = "[SIMULATED]" if trade['is_simulated'] else ""
+            
+            message = f"""
 {mode_emoji} <b>New Trade Copied!</b> {mode_text}
 
-<b>Symbol:</b> {symbol}
-<b>Side:</b> {side.upper()}
-<b>Your Size:</b> {size:.4f}
-<b>Entry:</b> ${entry_price:,.2f}
-<b>Leverage:</b> {leverage}x
-<b>Notional:</b> ${size * entry_price:,.2f}
+<b>Symbol:</b> {trade['symbol']}
+<b>Side:</b> {trade['side']}
+<b>Your Size:</b> {trade['size']:.4f}
+<b>Entry:</b> ${trade['entry_price']:,.2f}
+<b>Leverage:</b> {trade['leverage']}x
+<b>Notional:</b> ${trade['size'] * trade['entry_price']:,.2f}
 
 ━━━━━━━━━━━━━━━━━━
-<b>Target Size:</b> {target_size:.4f}
+<b>Target Size:</b> {trade['target_size']:.4f}
 <b>Time:</b> {datetime.now().strftime('%H:%M:%S UTC')}
 """
+        else:
+            mode_emoji = "🧪" if pending[0]['is_simulated'] else "✅"
+            lines = [
+                f"• {t['symbol']} {t['side']} {t['size']:.4f} @ ${t['entry_price']:,.2f} ({t['leverage']}x)"
+                for t in pending
+            ]
+            message = (
+                f"{mode_emoji} <b>{len(pending)} Trades Copied!</b>\n\n"
+                + "\n".join(lines)
+                + f"\n\n<b>Time:</b> {datetime.now().strftime('%H:%M:%S UTC')}"
+            )
+        
         await self.send_message(message.strip())
     
     async def send_position_close_notification(
@@ -0,0 +1,82 @@
+import asyncio
+import time
+from collections import deque
+from typing import Callable, Dict, Deque
+from loguru import logger
+
+
+class TGQueue:
+    """
+    Sliding-window rate limiter + send queue for Telegram messages
+
+    Telegram enforces ~30 messages/sec globally and ~20/min per chat;
+    exceeding them triggers 429 backoffs that stall the event loop.
+    Sends are queued and drained by a single worker that sleeps just
+    long enough to stay under both windows.
+    """
+
+    def __init__(self, rate_per_sec: float = 25.0, per_chat_per_minute: int = 20):
+        """
+        Args:
+            rate_per_sec: Global sends allowed per second (keep below 30)
+            per_chat_per_minute: Sends allowed per chat per minute
+        """
+        self.rate_per_sec = rate_per_sec
+        self.per_chat_per_minute = per_chat_per_minute
+
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._global_sends: Deque[float] = deque()
+        self._chat_sends: Dict[str, Deque[float]] = {}
+        self._worker: asyncio.Task = None
+
+    async def enqueue(self, send_func: Callable, chat_id: str):
+        """Queue one send; the drain worker starts lazily on first use
+
+        Args:
+            send_func: Zero-arg callable returning the send coroutine
+            chat_id: Chat the message goes to (for the per-chat window)
+        """
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._drain())
+        await self._queue.put((send_func, chat_id))
+
+    async def join(self):
+        """Wait until everything queued so far has been sent"""
+        await self._queue.join()
+
+    async def _wait_for_slot(self, chat_id: str):
+        """Sleep until both the global and per-chat windows have room"""
+        now = time.monotonic()
+
+        global_window = self._global_sends
+        while global_window and now - global_window[0] > 1.0:
+            global_window.popleft()
+
+        chat_window = self._chat_sends.setdefault(chat_id, deque())
+        while chat_window and now - chat_window[0] > 60.0:
+            chat_window.popleft()
+
+        delay = 0.0
+        if len(global_window) >= self.rate_per_sec:
+            delay = max(delay, 1.0 - (now - global_window[0]))
+        if len(chat_window) >= self.per_chat_per_minute:
+            delay = max(delay, 60.0 - (now - chat_window[0]))
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        sent_at = time.monotonic()
+        global_window.append(sent_at)
+        chat_window.append(sent_at)
+
+    async def _drain(self):
+        """Worker loop: pop, respect the windows, send"""
+        while True:
+            send_func, chat_id = await self._queue.get()
+            try:
+                await self._wait_for_slot(chat_id)
+                await send_func()
+            except Exception as e:
+                logger.error(f"Failed to send queued Telegram message: {e}")
+            finally:
+                self._queue.task_done()
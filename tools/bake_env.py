@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Bake the .env file into an importable Python module.
+
+Run at build/deploy time to skip dotenv parsing at every process start:
+
+    python tools/bake_env.py [path/to/.env]
+
+Writes src/config/_baked_env.py with the parsed key/value pairs as a
+Python literal. settings.py picks it up automatically when present and
+only falls back to dotenv parsing if the baked module is missing.
+"""
+
+import sys
+from pathlib import Path
+
+from dotenv import dotenv_values
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+OUTPUT_PATH = REPO_ROOT / "src" / "config" / "_baked_env.py"
+
+
+def bake(env_path: str = ".env") -> None:
+    values = {k: v for k, v in dotenv_values(env_path).items() if v is not None}
+
+    lines = [
+        '"""Generated by tools/bake_env.py - do not edit by hand."""',
+        "",
+        "ENV: dict[str, str] = {",
+    ]
+    for key in sorted(values):
+        lines.append(f"    {key!r}: {values[key]!r},")
+    lines.append("}")
+    lines.append("")
+
+    OUTPUT_PATH.write_text("\n".join(lines))
+    print(f"Baked {len(values)} env entries from {env_path} into {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    bake(sys.argv[1] if len(sys.argv) > 1 else ".env")